@@ -1,23 +1,60 @@
 """
 Meeting Scheduler MCP package initialization.
+
+The FastMCP server and the tool functions are created on first access, so
+importing the package stays cheap.
 """
 
-from fastmcp import FastMCP
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+_TOOLS = ("search_emails", "get_free_slots", "save_draft_and_block_slot")
+
+_mcp: FastMCP | None = None
+
+
+def build_mcp() -> FastMCP:
+    """Creates the FastMCP instance and registers all tools."""
+    from fastmcp import FastMCP
+
+    from .tools import get_free_slots, save_draft_and_block_slot, search_emails
+
+    mcp = FastMCP(
+        name="Meeting Scheduler",
+        instructions="A meeting scheduler that searches emails, manages calendars, and schedules meetings with full email threading support.",
+    )
+
+    # Register tools
+    mcp.tool(search_emails)
+    mcp.tool(get_free_slots)
+    mcp.tool(save_draft_and_block_slot)
+
+    return mcp
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily provides the shared ``mcp`` instance and the tool functions."""
+    global _mcp
+
+    if name == "mcp":
+        if _mcp is None:
+            _mcp = build_mcp()
+        return _mcp
+
+    if name in _TOOLS:
+        from . import tools
 
-from .tools import get_free_slots, save_draft_and_block_slot, search_emails
+        return getattr(tools, name)
 
-# Initialize FastMCP instance
-mcp = FastMCP(
-    name="Meeting Scheduler",
-    instructions="A meeting scheduler that searches emails, manages calendars, and schedules meetings with full email threading support.",
-)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Register tools
-mcp.tool(search_emails)
-mcp.tool(get_free_slots)
-mcp.tool(save_draft_and_block_slot)
 
 __all__ = [
+    "build_mcp",
     "mcp",
     "search_emails",
     "get_free_slots",
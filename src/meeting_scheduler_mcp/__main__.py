@@ -4,7 +4,7 @@ Entry point for the meeting scheduler MCP server.
 
 import logging
 
-from . import mcp
+from . import build_mcp
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,7 @@ def main():
     logger.info("Server running at http://0.0.0.0:8000")
 
     # Start the FastMCP server with HTTP transport
+    mcp = build_mcp()
     mcp.run(transport="streamable-http", host="0.0.0.0", port=8000)
 
 
@@ -6,21 +6,83 @@ Manages free and blocked time slots in a YAML file.
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
 from zoneinfo import ZoneInfo
 
-import yaml
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 from .holidays import HolidayChecker
 from .mail import EmailClientProtocol, IMAPEmailClient
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(dt: datetime) -> int:
+    """Microseconds since the Unix epoch (exact, unlike timestamp())."""
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+@lru_cache(maxsize=64)
+def get_tz(name: str) -> ZoneInfo:
+    """Returns the ZoneInfo for a timezone name, constructed once per name.
+
+    Cached results keyed by timezone, such as BlockedTime's bounds, compare
+    the ZoneInfo by identity, so timezones should be resolved through here.
+    """
+    return ZoneInfo(name)
+
+
+def _now(tz: ZoneInfo) -> datetime:
+    """Current time in a timezone; the single clock of this module."""
+    return datetime.now(tz)
+
+
+def _seconds(t: time) -> int:
+    """Seconds since midnight."""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def _minute_mask(start: int, end: int, inner: bool) -> int:
+    """Bitmask of the minutes of a day between two offsets in seconds.
+
+    With ``inner`` only whole minutes inside the range are included,
+    otherwise every minute the range touches.
+    """
+    if inner:
+        first, last = -(-start // 60), end // 60
+    else:
+        first, last = start // 60, -(-end // 60)
+    return ((1 << (last - first)) - 1) << first if last > first else 0
+
+
+def _time_at(seconds: int) -> time:
+    """Time of day for seconds since midnight."""
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return time(hour, minute, second)
+
 
 class Weekday(str, Enum):
     """Weekdays."""
@@ -35,10 +97,13 @@ class Weekday(str, Enum):
     @property
     def iso_weekday(self) -> int:
         """ISO weekday (1=Monday, 7=Sunday)."""
-        return {
-            self.MON: 1, self.TUE: 2, self.WED: 3, self.THU: 4,
-            self.FRI: 5, self.SAT: 6, self.SUN: 7,
-        }[self]
+        return _ISO_WEEKDAYS[self]
+
+
+_ISO_WEEKDAYS: dict[Weekday, int] = {
+    Weekday.MON: 1, Weekday.TUE: 2, Weekday.WED: 3, Weekday.THU: 4,
+    Weekday.FRI: 5, Weekday.SAT: 6, Weekday.SUN: 7,
+}
 
 
 class TimeSlot(BaseModel):
@@ -77,11 +142,30 @@ class BlockedTime(BaseModel):
     until: Optional[str] = None  # ISO 8601
     reason: Optional[str] = None
 
-    @model_validator(mode="after")
-    def validate_duration_or_until(self) -> "BlockedTime":
-        if self.duration is not None and self.until is not None:
+    # (default_tz, start, end, start_us, end_us), see get_bounds()
+    _bounds: tuple[ZoneInfo, datetime, datetime, int, int] | None = PrivateAttr(
+        default=None
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_duration_or_until(cls, data: Any) -> Any:
+        # Checked on the raw input, before any field is validated
+        if (
+            isinstance(data, dict)
+            and data.get("duration") is not None
+            and data.get("until") is not None
+        ):
             raise ValueError("Either duration or until must be specified, not both")
-        return self
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        # Compare fields only, the bounds cache must not affect equality
+        if not isinstance(other, BlockedTime):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
 
     def is_all_day(self) -> bool:
         """Checks if this is an all-day block."""
@@ -89,29 +173,58 @@ class BlockedTime(BaseModel):
 
     def get_start(self, default_tz: ZoneInfo) -> datetime:
         """Parses datetime and returns start."""
+        cached = self._bounds
+        if cached is not None and cached[0] is default_tz:
+            return cached[1]
+        return self._parse_start(default_tz)
+
+    def get_end(self, default_tz: ZoneInfo) -> datetime:
+        """Calculates end timepoint."""
+        return self.get_bounds(default_tz)[1]
+
+    def get_bounds(self, default_tz: ZoneInfo) -> tuple[datetime, datetime]:
+        """Returns start and end, parsed once per timezone."""
+        return self._get_cached_bounds(default_tz)[1:3]
+
+    def get_bounds_us(self, default_tz: ZoneInfo) -> tuple[int, int]:
+        """Returns start and end as epoch microseconds, parsed once per timezone."""
+        return self._get_cached_bounds(default_tz)[3:]
+
+    def _get_cached_bounds(
+        self, default_tz: ZoneInfo
+    ) -> tuple[ZoneInfo, datetime, datetime, int, int]:
+        cached = self._bounds
+        if cached is None or cached[0] is not default_tz:
+            start, end = self._parse_bounds(default_tz)
+            cached = (default_tz, start, end, _epoch_us(start), _epoch_us(end))
+            self._bounds = cached
+        return cached
+
+    def _parse_start(self, default_tz: ZoneInfo) -> datetime:
         if self.is_all_day():
             d = date.fromisoformat(self.datetime)
             return datetime.combine(d, time(0, 0), tzinfo=default_tz)
         return datetime.fromisoformat(self.datetime)
 
-    def get_end(self, default_tz: ZoneInfo) -> datetime:
-        """Calculates end timepoint."""
-        start = self.get_start(default_tz)
+    def _parse_bounds(self, default_tz: ZoneInfo) -> tuple[datetime, datetime]:
+        start = self._parse_start(default_tz)
 
         if self.until:
             if "T" in self.until:
-                return datetime.fromisoformat(self.until)
+                return start, datetime.fromisoformat(self.until)
             else:
                 # All day until end of until date
                 d = date.fromisoformat(self.until)
-                return datetime.combine(d, time(23, 59, 59), tzinfo=default_tz)
+                return start, datetime.combine(d, time(23, 59, 59), tzinfo=default_tz)
 
         if self.duration:
-            return start + timedelta(minutes=self.duration)
+            return start, start + timedelta(minutes=self.duration)
 
         # All day
         if self.is_all_day():
-            return datetime.combine(start.date(), time(23, 59, 59), tzinfo=default_tz)
+            return start, datetime.combine(
+                start.date(), time(23, 59, 59), tzinfo=default_tz
+            )
 
         raise ValueError("Either duration, until, or all-day date required")
 
@@ -127,14 +240,26 @@ class Schedule(BaseModel):
     @classmethod
     def validate_timezone(cls, v: str) -> str:
         try:
-            ZoneInfo(v)
+            get_tz(v)
         except KeyError:
             raise ValueError(f"Invalid timezone: {v}")
         return v
 
     def get_tz(self) -> ZoneInfo:
         """Returns ZoneInfo."""
-        return ZoneInfo(self.timezone)
+        return get_tz(self.timezone)
+
+    def weekday_slots(self) -> dict[int, tuple[TimeSlot, ...]]:
+        """Returns ISO weekday -> time slots available on that day.
+
+        Built from the current weekly list on every call; SlotFinder calls it
+        once per calendar snapshot, so in-place edits are never missed.
+        """
+        table: dict[int, list[TimeSlot]] = {}
+        for weekly in self.weekly:
+            for day in dict.fromkeys(weekly.days):
+                table.setdefault(day.iso_weekday, []).extend(weekly.slots)
+        return {day: tuple(slots) for day, slots in table.items()}
 
 
 class Calendar(BaseModel):
@@ -142,10 +267,29 @@ class Calendar(BaseModel):
     schedule: Schedule
     blocked: list[BlockedTime] = Field(default_factory=list)
 
+    @model_validator(mode="after")
+    def resolve_blocked_bounds(self) -> "Calendar":
+        """Parses blocked times once against the schedule's timezone."""
+        tz = self.schedule.get_tz()
+        for blocked in self.blocked:
+            try:
+                blocked.get_bounds_us(tz)
+            except (ValueError, TypeError):
+                # Left for SlotFinder to report, as before
+                pass
+        return self
+
+
+_WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AvailableSlot:
-    """An available time slot."""
+    """An available time slot.
+
+    Frozen because SlotFinder hands out the same cached instances to every
+    caller of the same search.
+    """
 
     date: date
     start_time: time
@@ -153,16 +297,8 @@ class AvailableSlot:
     timezone: str
 
     def __str__(self) -> str:
-        weekdays = {
-            1: "Mon",
-            2: "Tue",
-            3: "Wed",
-            4: "Thu",
-            5: "Fri",
-            6: "Sat",
-            7: "Sun",
-        }
-        return f"{weekdays[self.date.isoweekday()]} {self.date.strftime('%d.%m.')}, {self.start_time.strftime('%H:%M')}"
+        d, t = self.date, self.start_time
+        return f"{_WEEKDAY_NAMES[d.weekday()]} {d.day:02d}.{d.month:02d}., {t.hour:02d}:{t.minute:02d}"
 
     def to_dict(self) -> dict[str, str]:
         """Serialize to dictionary for API responses."""
@@ -174,25 +310,119 @@ class AvailableSlot:
         }
 
 
+class _CalendarSidecar(BaseModel):
+    """JSON cache of a parsed calendar.yaml."""
+    source: tuple[int, int]  # (st_mtime_ns, st_size) of the YAML it mirrors
+    calendar: Calendar
+
+
+def _write_atomic(path: Path, payload: bytes, durable: bool = True) -> None:
+    """Writes payload to a unique temporary sibling and renames it over path."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        # mkstemp creates the file private; keep the mode of the file replaced
+        try:
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            pass
+        with open(fd, "wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class CalendarStore:
-    """Loads and saves calendar.yaml."""
+    """Loads and saves calendar.yaml.
+
+    Next to the YAML file a ``<name>.cache.json`` sidecar is kept, which lets a
+    fresh process skip YAML parsing as long as the YAML file is unchanged.
+    """
 
     def __init__(self, path: Path | str):
         self.path = Path(path)
+        self.sidecar_path = self.path.with_suffix(".cache.json")
+        # (st_mtime_ns, st_size) of the file the cached calendar was parsed from
+        self._cache: tuple[tuple[int, int], Calendar] | None = None
+        # Serializes read-modify-write cycles of tools running in threads
+        self._lock = threading.RLock()
+
+    def _stat_key(self) -> tuple[int, int]:
+        """Returns the key identifying the current file contents."""
+        st = self.path.stat()
+        return st.st_mtime_ns, st.st_size
 
     def load(self) -> Calendar:
-        """Load calendar from YAML."""
-        with open(self.path) as f:
-            data = yaml.safe_load(f)
-        return Calendar.model_validate(data)
+        """Load calendar from YAML.
 
-    def save(self, calendar: Calendar) -> None:
-        """Save calendar as YAML."""
-        data = calendar.model_dump(mode="json")
-        with open(self.path, "w") as f:
-            yaml.dump(
-                data, f, default_flow_style=False, allow_unicode=True, sort_keys=False
+        The parsed calendar is cached until the file's mtime or size changes.
+        Callers must not mutate the returned instance.
+        """
+        key = self._stat_key()
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+
+        calendar = self._load_sidecar(key)
+        if calendar is None:
+            import yaml
+
+            # Prefer the libyaml-backed loader, fall back to pure Python
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(self.path, "rb") as f:
+                data = yaml.load(f, Loader=loader)
+            calendar = Calendar.model_validate(data)
+        self._cache = (key, calendar)
+        return calendar
+
+    def _load_sidecar(self, key: tuple[int, int]) -> Calendar | None:
+        """Returns the calendar from the JSON sidecar if it matches the YAML file."""
+        try:
+            sidecar = _CalendarSidecar.model_validate_json(
+                self.sidecar_path.read_bytes()
             )
+        except (OSError, ValueError):
+            return None
+        return sidecar.calendar if sidecar.source == key else None
+
+    def save(self, calendar: Calendar) -> None:
+        """Save calendar as YAML.
+
+        The document is written to a temporary file in one write, synced and
+        renamed over the calendar, so readers never see a partial file. The
+        saved instance becomes the cached calendar and must not be mutated.
+        """
+        import yaml
+
+        with self._lock:
+            self._cache = None
+            data = calendar.model_dump(mode="json")
+            payload = yaml.dump(
+                data,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            ).encode("utf-8")
+            _write_atomic(self.path, payload)
+
+            # The saved instance is what a reload would produce; cache it directly
+            key = self._stat_key()
+            self._cache = (key, calendar)
+
+            try:
+                sidecar = _CalendarSidecar(source=key, calendar=calendar)
+                _write_atomic(
+                    self.sidecar_path, sidecar.model_dump_json().encode(), durable=False
+                )
+            except OSError as e:
+                logger.warning(
+                    "Could not write calendar cache %s: %s", self.sidecar_path, e
+                )
 
     def add_blocked(
         self,
@@ -201,9 +431,11 @@ class CalendarStore:
         until: datetime | None = None,
         reason: str | None = None,
     ) -> None:
-        """Add a blocked time."""
-        calendar = self.load()
+        """Add a blocked time.
 
+        Builds on the cached calendar, so only the save touches the disk.
+        Concurrent calls on the same store are serialized, so no block is lost.
+        """
         blocked = BlockedTime(
             datetime=dt.isoformat(),
             duration=duration,
@@ -211,8 +443,12 @@ class CalendarStore:
             reason=reason,
         )
 
-        calendar.blocked.append(blocked)
-        self.save(calendar)
+        with self._lock:
+            calendar = self.load()
+            # Copy instead of appending in place: the loaded calendar may be cached
+            self.save(
+                calendar.model_copy(update={"blocked": [*calendar.blocked, blocked]})
+            )
 
 
 class SlotFinder:
@@ -223,6 +459,76 @@ class SlotFinder:
         self.tz = calendar.schedule.get_tz()
         self.holiday_checker = HolidayChecker(calendar.schedule.holidays)
 
+        self._by_weekday = calendar.schedule.weekday_slots()
+
+        # ISO weekday -> (seconds past midnight, start, end) of each slot
+        step = calendar.schedule.slot_duration * 60
+        self._day_slots: dict[int, tuple[tuple[int, time, time], ...]] = {}
+        for weekday, time_slots in self._by_weekday.items():
+            self._day_slots[weekday] = tuple(
+                (offset, _time_at(offset), _time_at(offset + step))
+                for time_slot in time_slots
+                for offset in range(
+                    _seconds(time_slot.start), _seconds(time_slot.end) - step + 1, step
+                )
+            )
+        self._step_us = step * 1_000_000
+
+        # ISO weekday -> bitmask of the minutes of the day (bit 0 = 00:00)
+        # lying entirely within some time slot of that day
+        self._minute_masks: dict[int, int] = {}
+        for weekday, time_slots in self._by_weekday.items():
+            mask = 0
+            for time_slot in time_slots:
+                mask |= _minute_mask(
+                    _seconds(time_slot.start), _seconds(time_slot.end), True
+                )
+            self._minute_masks[weekday] = mask
+
+        # Jump tables indexed by ISO weekday: days from there to the next
+        # weekday with availability, counting the day itself or not. Empty if
+        # no weekday has any availability.
+        open_days = [day for day, slots in self._by_weekday.items() if slots]
+        self._to_open_day: list[timedelta] = []
+        self._to_next_open_day: list[timedelta] = []
+        if open_days:
+            for weekday in range(8):
+                self._to_open_day.append(
+                    timedelta(days=min((day - weekday) % 7 for day in open_days))
+                )
+                self._to_next_open_day.append(
+                    timedelta(days=min((day - weekday - 1) % 7 + 1 for day in open_days))
+                )
+
+        # Blocked intervals sorted by start for binary-search overlap queries,
+        # stored as parallel arrays of epoch microseconds
+        blocks = sorted(
+            (
+                (*blocked.get_bounds_us(self.tz), blocked)
+                for blocked in calendar.blocked
+            ),
+            key=lambda block: block[0],
+        )
+        self._block_starts = array("q", (start for start, _, _ in blocks))
+        # Prefix maxima over the blocks in start order: of the blocks at or
+        # before i, none ends later than _block_max_ends[i], which is the end
+        # of _block_reaching[i]
+        self._block_max_ends = array("q")
+        self._block_reaching: list[BlockedTime] = []
+        for _, end, blocked in blocks:
+            if self._block_max_ends and end <= self._block_max_ends[-1]:
+                end, blocked = self._block_max_ends[-1], self._block_reaching[-1]
+            self._block_max_ends.append(end)
+            self._block_reaching.append(blocked)
+        # Overall span of all blocks, for answering most queries without a search
+        self._blocked_from = self._block_starts[0] if blocks else 0
+        self._blocked_until = self._block_max_ends[-1] if blocks else 0
+
+        # Results per search window. The finder is bound to this calendar and
+        # indexes its blocked times above, so the calendar needs no cache key:
+        # a changed calendar gets a new SlotFinder (see CalendarManager).
+        self._find_slots = lru_cache(maxsize=128)(self._find_slots_uncached)
+
     def find_available_slots(
         self,
         from_date: date | None = None,
@@ -232,93 +538,155 @@ class SlotFinder:
     ) -> list[AvailableSlot]:
         """Find available slots."""
 
-        now = datetime.now(self.tz)
-        from_date = from_date or now.date()
-        to_date = to_date or (from_date + timedelta(days=30))
-        min_bookable = now + timedelta(hours=min_notice_hours)
-
-        available: list[AvailableSlot] = []
-        current = from_date
+        window = self._resolve_window(from_date, to_date, min_notice_hours)
+        return list(self._find_slots(*window, max(max_results, 0)))
 
-        while current <= to_date and len(available) < max_results:
-            day_slots = self._get_slots_for_date(current, min_bookable)
-            available.extend(day_slots)
-            current += timedelta(days=1)
+    def iter_available_slots(
+        self,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        min_notice_hours: int = 2,
+    ) -> Iterator[AvailableSlot]:
+        """Yield available slots in order, computing each one only when it is consumed."""
 
-        return available[:max_results]
+        return self._iter_slots(
+            *self._resolve_window(from_date, to_date, min_notice_hours)
+        )
 
-    def _get_slots_for_date(
-        self, d: date, min_bookable: datetime
-    ) -> list[AvailableSlot]:
-        """Generate slots for a date."""
+    def _resolve_window(
+        self, from_date: date | None, to_date: date | None, min_notice_hours: int
+    ) -> tuple[date, date, date, int]:
+        """Resolve the searched days and the first bookable day and offset."""
 
-        # Holiday?
-        if self.holiday_checker.is_holiday(d):
-            return []
+        now = _now(self.tz)
+        from_date = from_date or now.date()
+        to_date = to_date or (from_date + timedelta(days=30))
+        min_bookable = now + timedelta(hours=min_notice_hours)
 
-        # Find weekday
-        iso_weekday = d.isoweekday()
-        weekly_slots: list[TimeSlot] = []
+        # Slots on the first bookable day must not start before this many
+        # seconds past midnight. Rounded up to the next slot start, so that
+        # repeated searches keep hitting the cache until that slot has passed.
+        bookable_date = min_bookable.date()
+        bookable_from = self._next_slot_start(
+            bookable_date,
+            _seconds(min_bookable.time()) + bool(min_bookable.microsecond),
+        )
+        return from_date, to_date, bookable_date, bookable_from
+
+    def _next_slot_start(self, d: date, bookable_from: int) -> int:
+        """First slot start on ``d`` at or after ``bookable_from`` (end of day if none)."""
+
+        return min(
+            (
+                offset
+                for offset, _, _ in self._day_slots.get(d.isoweekday(), ())
+                if offset >= bookable_from
+            ),
+            default=86400,
+        )
 
-        for weekly in self.calendar.schedule.weekly:
-            if any(day.iso_weekday == iso_weekday for day in weekly.days):
-                weekly_slots.extend(weekly.slots)
+    def _find_slots_uncached(
+        self,
+        from_date: date,
+        to_date: date,
+        bookable_date: date,
+        bookable_from: int,
+        max_results: int,
+    ) -> tuple[AvailableSlot, ...]:
+        return tuple(
+            islice(
+                self._iter_slots(from_date, to_date, bookable_date, bookable_from),
+                max_results,
+            )
+        )
 
-        if not weekly_slots:
-            return []
+    def _iter_slots(
+        self, from_date: date, to_date: date, bookable_date: date, bookable_from: int
+    ) -> Iterator[AvailableSlot]:
+        if not self._to_open_day:
+            return
 
-        # Generate slots
-        slot_duration = timedelta(minutes=self.calendar.schedule.slot_duration)
-        available: list[AvailableSlot] = []
-
-        for time_slot in weekly_slots:
-            current = datetime.combine(d, time_slot.start, tzinfo=self.tz)
-            end = datetime.combine(d, time_slot.end, tzinfo=self.tz)
-
-            while current + slot_duration <= end:
-                slot_start = current.time()
-                slot_end = (current + slot_duration).time()
-
-                if current >= min_bookable and not self._is_blocked(
-                    d, slot_start, slot_end
-                ):
-                    available.append(
-                        AvailableSlot(
-                            date=d,
-                            start_time=slot_start,
-                            end_time=slot_end,
-                            timezone=self.calendar.schedule.timezone,
-                        )
-                    )
+        # Visit only weekdays with availability, jumping over the others
+        current = from_date + self._to_open_day[from_date.isoweekday()]
+        to_next_open_day = self._to_next_open_day
 
-                current += slot_duration
+        while current <= to_date:
+            yield from self._iter_slots_for_date(current, bookable_date, bookable_from)
+            current += to_next_open_day[current.isoweekday()]
 
-        return available
+    def _iter_slots_for_date(
+        self, d: date, bookable_date: date, bookable_from: int
+    ) -> Iterator[AvailableSlot]:
+        """Generate the available slots of a date."""
 
-    def _is_blocked(self, d: date, start: time, end: time) -> bool:
-        """Check if slot is blocked."""
+        # Weekday available? Checked first, it rules out weekends cheaply
+        day_slots = self._day_slots.get(d.isoweekday())
+        if not day_slots:
+            return
 
-        slot_start = datetime.combine(d, start, tzinfo=self.tz)
-        slot_end = datetime.combine(d, end, tzinfo=self.tz)
+        # Holiday?
+        if self.holiday_checker.is_holiday(d):
+            return
+
+        # Nothing is bookable before the first bookable day, all of later days
+        if d < bookable_date:
+            return
+        if d > bookable_date:
+            bookable_from = 0
+
+        # Without a UTC offset change during the day, slot bounds are plain
+        # offsets from midnight; otherwise each wall time is resolved alone
+        tz = self.tz
+        midnight = datetime.combine(d, time(0), tzinfo=tz)
+        if midnight.utcoffset() == (midnight + timedelta(days=1)).utcoffset():
+            midnight_us = _epoch_us(midnight)
+        else:
+            midnight_us = None
+
+        step_us = self._step_us
+
+        for offset, slot_start, slot_end in day_slots:
+            if offset < bookable_from:
+                continue
+
+            if midnight_us is not None:
+                start_us = midnight_us + offset * 1_000_000
+                blocked = self._find_block(start_us, start_us + step_us)
+            else:
+                blocked = self._find_block(
+                    _epoch_us(datetime.combine(d, slot_start, tzinfo=tz)),
+                    _epoch_us(datetime.combine(d, slot_end, tzinfo=tz)),
+                )
+            if blocked is None:
+                yield AvailableSlot(
+                    date=d,
+                    start_time=slot_start,
+                    end_time=slot_end,
+                    timezone=self.calendar.schedule.timezone,
+                )
 
-        for blocked in self.calendar.blocked:
-            block_start = blocked.get_start(self.tz)
-            block_end = blocked.get_end(self.tz)
+    def _find_block(self, slot_start: int, slot_end: int) -> BlockedTime | None:
+        """Return a blocked time overlapping the slot (epoch microseconds)."""
 
-            # Check overlap
-            if slot_start < block_end and block_start < slot_end:
-                return True
+        # Entirely before the first or after the last block?
+        if slot_end <= self._blocked_from or self._blocked_until <= slot_start:
+            return None
 
-        return False
+        # Only blocks starting before the slot ends can overlap it. One of them
+        # does exactly if the one reaching furthest ends after the slot starts.
+        i = bisect_left(self._block_starts, slot_end) - 1
+        if self._block_max_ends[i] <= slot_start:
+            return None
+        return self._block_reaching[i]
 
     def is_slot_bookable(self, d: date, start: time, end: time) -> tuple[bool, str]:
         """Check if a slot is bookable."""
 
-        now = datetime.now(self.tz)
-        slot_dt = datetime.combine(d, start, tzinfo=self.tz)
+        now = _now(self.tz)
+        slot_start = datetime.combine(d, start, tzinfo=self.tz)
 
         # Past?
-        if slot_dt < now:
+        if slot_start < now:
             return False, "Timepoint is in the past"
 
         # Holiday?
@@ -326,30 +694,21 @@ class SlotFinder:
             name = self.holiday_checker.get_holiday_name(d) or "Holiday"
             return False, f"{name}"
 
-        # Weekday available?
-        iso_weekday = d.isoweekday()
-        day_available = False
-
-        for weekly in self.calendar.schedule.weekly:
-            if any(day.iso_weekday == iso_weekday for day in weekly.days):
-                for slot in weekly.slots:
-                    if slot.start <= start and end <= slot.end:
-                        day_available = True
-                        break
+        # Weekday available? Every minute touched must be covered
+        needed = _minute_mask(_seconds(start), _seconds(end), False)
+        day_available = (
+            needed != 0
+            and self._minute_masks.get(d.isoweekday(), 0) & needed == needed
+        )
 
         if not day_available:
             return False, "Outside of availability"
 
         # Blocked?
-        if self._is_blocked(d, start, end):
-            for blocked in self.calendar.blocked:
-                block_start = blocked.get_start(self.tz)
-                block_end = blocked.get_end(self.tz)
-                slot_start = datetime.combine(d, start, tzinfo=self.tz)
-                slot_end = datetime.combine(d, end, tzinfo=self.tz)
-
-                if slot_start < block_end and block_start < slot_end:
-                    return False, blocked.reason or "Blocked"
+        slot_end = datetime.combine(d, end, tzinfo=self.tz)
+        blocked = self._find_block(_epoch_us(slot_start), _epoch_us(slot_end))
+        if blocked is not None:
+            return False, blocked.reason or "Blocked"
 
         return True, ""
 
@@ -358,9 +717,27 @@ class CalendarManager:
     """Manages the calendar in a YAML file."""
 
     def __init__(self, file_path: str = "calendar.yaml"):
+        self._open(file_path)
+        self._ensure_file_exists()
+
+    @classmethod
+    def from_calendar(
+        cls, calendar: Calendar, file_path: str = "calendar.yaml"
+    ) -> CalendarManager:
+        """Creates a manager whose file is written from an already parsed calendar.
+
+        The calendar becomes the store's cached instance, so neither the
+        default calendar is built nor the YAML file parsed again.
+        """
+        manager = cls.__new__(cls)
+        manager._open(file_path)
+        manager.calendar_store.save(calendar)
+        return manager
+
+    def _open(self, file_path: str) -> None:
         self.file_path = Path(file_path)
         self.calendar_store = CalendarStore(file_path)
-        self._ensure_file_exists()
+        self._slot_finder: SlotFinder | None = None
 
     def _ensure_file_exists(self) -> None:
         """Ensures that the calendar file exists."""
@@ -391,16 +768,40 @@ class CalendarManager:
             )
             self.calendar_store.save(default_calendar)
 
-    def get_free_slots(self) -> List[AvailableSlot]:
+    def _get_slot_finder(self) -> SlotFinder:
+        """Returns a SlotFinder for the current calendar.
+
+        The finder's pre-parsed blocked times and weekday index are reused for
+        as long as the store hands out the same cached Calendar instance.
+        """
+        calendar = self.calendar_store.load()
+        if self._slot_finder is None or self._slot_finder.calendar is not calendar:
+            self._slot_finder = SlotFinder(calendar)
+        return self._slot_finder
+
+    def iter_free_slots(self) -> Iterator[AvailableSlot]:
+        """Yields the free time slots of the next 30 days in order.
+
+        Each slot is only computed when it is consumed, so callers that stop
+        early do not pay for the rest of the window. Errors are raised.
+
+        Returns:
+            Iterator[AvailableSlot]: Free time slots
+        """
+        return self._get_slot_finder().iter_available_slots()
+
+    def get_free_slots(self, limit: int = 50) -> List[AvailableSlot]:
         """Gets all free (unblocked) time slots using the PRD slot finder.
 
+        Args:
+            limit: Maximum number of slots to return
+
         Returns:
             List[AvailableSlot]: List of free time slots
         """
         try:
-            calendar = self.calendar_store.load()
-            finder = SlotFinder(calendar)
-            return finder.find_available_slots(max_results=50)
+            finder = self._get_slot_finder()
+            return finder.find_available_slots(max_results=limit)
         except FileNotFoundError as e:
             logger.error("Calendar file not found: %s", e)
             return []
@@ -2,17 +2,26 @@
 Holiday service for calendar component.
 """
 
-from datetime import date
-from typing import Optional, Protocol, cast
-
-import pandas as pd
-from pandas.tseries.holiday import (
-    AbstractHolidayCalendar,
-    EasterMonday,
-    GoodFriday,
-    Holiday,
-)
-from pandas.tseries.offsets import Day, Easter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Protocol
+
+
+def _easter(year: int) -> date:
+    """Easter Sunday in the Gregorian calendar (Meeus/Jones/Butcher)."""
+    golden = year % 19
+    century, year_of_century = divmod(year, 100)
+    leap_centuries, century_rest = divmod(century, 4)
+    correction = (century + 8) // 25
+    moon = (century - correction + 1) // 3
+    epact = (19 * golden + century - leap_centuries - moon + 15) % 30
+    leap_years, year_rest = divmod(year_of_century, 4)
+    weekday = (32 + 2 * century_rest + 2 * leap_years - epact - year_rest) % 7
+    shift = (golden + 11 * epact + 22 * weekday) // 451
+    month, day = divmod(epact + weekday - 7 * shift + 114, 31)
+    return date(year, month, day + 1)
 
 
 class HolidayRule(Protocol):
@@ -20,65 +29,99 @@ class HolidayRule(Protocol):
 
     name: str
 
-    def dates(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex: ...
+    def date_in(self, year: int) -> date: ...
+
+
+@dataclass(frozen=True, slots=True)
+class FixedHoliday:
+    """Holiday on the same calendar day every year."""
+
+    name: str
+    month: int
+    day: int
+
+    def date_in(self, year: int) -> date:
+        return date(year, self.month, self.day)
+
+
+@dataclass(frozen=True, slots=True)
+class EasterHoliday:
+    """Holiday a fixed number of days after Easter Sunday."""
+
+    name: str
+    days: int
+
+    def date_in(self, year: int) -> date:
+        return _easter(year) + timedelta(days=self.days)
+
+
+GERMAN_BANK_HOLIDAYS: tuple[HolidayRule, ...] = (
+    FixedHoliday("New Year's Day", month=1, day=1),
+    EasterHoliday("Good Friday", days=-2),
+    EasterHoliday("Easter Monday", days=1),
+    EasterHoliday("Ascension Day", days=39),
+    EasterHoliday("Whit Monday", days=50),
+    FixedHoliday("Labor Day", month=5, day=1),
+    FixedHoliday("German Unity Day", month=10, day=3),
+    FixedHoliday("Reformation Day", month=10, day=31),
+    FixedHoliday("Christmas Eve", month=12, day=24),
+    FixedHoliday("Christmas Day", month=12, day=25),
+    FixedHoliday("Boxing Day", month=12, day=26),
+    FixedHoliday("New Year's Eve", month=12, day=31),
+)
+"""German public holidays."""
+
+
+_CALENDARS: dict[str, tuple[HolidayRule, ...]] = {
+    "DE": GERMAN_BANK_HOLIDAYS,
+}
+
+
+_NO_HOLIDAYS: tuple[frozenset[date], Mapping[date, str]] = (
+    frozenset(),
+    MappingProxyType({}),
+)
 
 
-class GermanBankHolidays(AbstractHolidayCalendar):
-    """German public holidays."""
+@lru_cache(maxsize=64)
+def _load_year(
+    country_code: str, year: int
+) -> tuple[frozenset[date], Mapping[date, str]]:
+    """Computes the holidays of one year and their names, once per process."""
+    names: dict[date, str] = {}
+    for rule in _CALENDARS[country_code]:
+        names.setdefault(rule.date_in(year), rule.name)
 
-    rules = [
-        Holiday("New Year's Day", month=1, day=1),
-        GoodFriday,
-        EasterMonday,
-        Holiday("Ascension Day", month=1, day=1, offset=[Easter(), Day(39)]),
-        Holiday("Whit Monday", month=1, day=1, offset=[Easter(), Day(50)]),
-        Holiday("Labor Day", month=5, day=1),
-        Holiday("German Unity Day", month=10, day=3),
-        Holiday("Reformation Day", month=10, day=31),
-        Holiday("Christmas Eve", month=12, day=24),
-        Holiday("Christmas Day", month=12, day=25),
-        Holiday("Boxing Day", month=12, day=26),
-        Holiday("New Year's Eve", month=12, day=31),
-    ]
+    return frozenset(names), MappingProxyType(names)
 
 
 class HolidayChecker:
     """Checks if a date is a holiday."""
 
-    _calendars: dict[str, AbstractHolidayCalendar] = {
-        "DE": GermanBankHolidays(),
-    }
+    _calendars = _CALENDARS
 
     def __init__(self, country_code: Optional[str] = None):
         self.country_code = country_code
-        self._holidays: set[date] = set()
-
-        if country_code and country_code in self._calendars:
-            cal = self._calendars[country_code]
-            # Cache holidays for the next 3 years (including current year)
-            start = pd.Timestamp.now().floor("D") - pd.DateOffset(years=1)
-            end = start + pd.DateOffset(years=3)
-            holidays = cal.holidays(start=start, end=end)
-            self._holidays = {d.date() for d in holidays}
+        self._country = country_code if country_code in self._calendars else None
+        # Year -> holiday dates and names, filled on first access
+        self._years: dict[int, tuple[frozenset[date], Mapping[date, str]]] = {}
+
+    def _for_year(self, year: int) -> tuple[frozenset[date], Mapping[date, str]]:
+        try:
+            return self._years[year]
+        except KeyError:
+            loaded = _load_year(self._country, year) if self._country else _NO_HOLIDAYS
+            self._years[year] = loaded
+            return loaded
+
+    def holidays_in(self, year: int) -> frozenset[date]:
+        """All holiday dates of a year."""
+        return self._for_year(year)[0]
 
     def is_holiday(self, d: date) -> bool:
         """Checks if date is a holiday."""
-        return d in self._holidays
+        return d in self._for_year(d.year)[0]
 
     def get_holiday_name(self, d: date) -> Optional[str]:
         """Returns holiday name or None."""
-        if not self.country_code or self.country_code not in self._calendars:
-            return None
-
-        cal = self._calendars[self.country_code]
-        ts = pd.Timestamp(d)
-
-        for rule in cal.rules:
-            try:
-                rule_dates = rule.dates(ts, ts + pd.DateOffset(days=1))
-                if len(rule_dates) > 0 and rule_dates[0].date() == d:
-                    return cast(HolidayRule, rule).name
-            except (ValueError, KeyError, AttributeError):
-                continue
-
-        return None
+        return self._for_year(d.year)[1].get(d)
@@ -3,15 +3,37 @@ IMAP client for the meeting scheduler.
 Uses .env for configuration and provides email operation functions.
 """
 
+import base64
+import binascii
 import email
 import email.message
 import imaplib
 import logging
 import os
+import quopri
+import re
 import ssl
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from email.parser import BytesHeaderParser, BytesParser
+from email.policy import default as default_policy
+from functools import lru_cache
+from itertools import takewhile
 from ssl import SSLError
-from typing import Dict, List, Protocol, Tuple, Union
+from typing import (
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from dotenv import load_dotenv
 
@@ -20,6 +42,337 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of message ids sent in a single FETCH command; some servers
+# reject longer command lines with "maximum request size exceeded".
+FETCH_BATCH_SIZE = 100
+
+# Number of UID FETCH commands sent ahead before their responses are read.
+# Bounded so that a server that stops reading while it writes a large
+# response cannot deadlock against our pending command lines.
+FETCH_PIPELINE_DEPTH = 8
+
+# Servers may drop connections idle for 30 minutes (RFC 3501, 5.4), so a
+# shared connection is probed with NOOP before it gets that old.
+KEEPALIVE_INTERVAL = 25 * 60
+
+
+class IMAPConfig(NamedTuple):
+    """IMAP settings read from the environment."""
+
+    host: Optional[str]
+    user: Optional[str]
+    password: Optional[str]
+    port: str
+    use_ssl: bool
+    use_starttls: bool
+    verify_ssl: bool
+    drafts_folder: str
+    from_address: Optional[str]
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a "true"/"false" environment variable."""
+    value = os.getenv(name)
+    return value.lower() == "true" if value else default
+
+
+@lru_cache(maxsize=1)
+def _load_imap_config() -> IMAPConfig:
+    """Read the IMAP settings once; the environment is fixed after startup."""
+    return IMAPConfig(
+        host=os.getenv("IMAP_HOST"),
+        user=os.getenv("IMAP_USER"),
+        password=os.getenv("IMAP_PASSWORD"),
+        port=os.getenv("IMAP_PORT", "993"),
+        use_ssl=_env_flag("IMAP_USE_SSL", True),
+        use_starttls=_env_flag("IMAP_USE_STARTTLS", False),
+        verify_ssl=_env_flag("IMAP_VERIFY_SSL", True),
+        drafts_folder=os.getenv("IMAP_DRAFT_FOLDER", "INBOX.Drafts"),
+        from_address=os.getenv("IMAP_FROM", os.getenv("IMAP_USER")),
+    )
+
+
+@lru_cache(maxsize=2)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """Build the SSL context once and share it between connections."""
+    ssl_context = ssl.create_default_context()
+    if not verify:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+@lru_cache(maxsize=32)
+def _encode_criteria(criteria: str) -> Tuple[bytes, ...]:
+    """Encode search criteria once into the arguments of UID SEARCH.
+
+    imaplib would encode str arguments as ASCII on every call; non-ASCII
+    criteria are sent as UTF-8 with a CHARSET specification instead.
+    """
+    encoded = criteria.encode("utf-8")
+    if encoded.isascii():
+        return (encoded,)
+    return (b"CHARSET", b"UTF-8", encoded)
+
+
+# Largest literal a LITERAL- server accepts without synchronization (RFC 7888)
+_LITERAL_MINUS_MAX = 4096
+
+
+class _LiteralPlusMixin:
+    """Send APPEND literals without waiting for the server (RFC 7888).
+
+    With LITERAL+ (or LITERAL- for small messages) the client may append the
+    literal right after ``{size+}`` instead of waiting for a ``+``
+    continuation, which saves one round trip per APPEND.
+    """
+
+    def append(self, mailbox, flags, date_time, message):
+        literal = imaplib.MapCRLF.sub(imaplib.CRLF, message)
+        capabilities = self.capabilities
+        if self.utf8_enabled or not (
+            "LITERAL+" in capabilities
+            or ("LITERAL-" in capabilities and len(literal) <= _LITERAL_MINUS_MAX)
+        ):
+            return super().append(mailbox, flags, date_time, message)
+
+        if flags:
+            if (flags[0], flags[-1]) != ("(", ")"):
+                flags = f"({flags})"
+        else:
+            flags = None
+        date_time = imaplib.Time2Internaldate(date_time) if date_time else None
+        literal_arg = b"{%d+}" % len(literal) + imaplib.CRLF + literal
+        return self._simple_command(
+            "APPEND", mailbox or "INBOX", flags, date_time, literal_arg
+        )
+
+    def login(self, user, password):
+        typ, dat = super().login(user, password)
+        # Servers may announce more capabilities once authenticated
+        _, capabilities = self.response("CAPABILITY")
+        if capabilities[-1]:
+            self.capabilities = tuple(capabilities[-1].decode("ascii").upper().split())
+        return typ, dat
+
+
+class _IMAP4(_LiteralPlusMixin, imaplib.IMAP4):
+    pass
+
+
+class _IMAP4_SSL(_LiteralPlusMixin, imaplib.IMAP4_SSL):
+    pass
+
+
+# Headers returned by get_email_metadata
+_METADATA_FIELDS = "SUBJECT FROM TO DATE MESSAGE-ID IN-REPLY-TO REFERENCES"
+
+# PEEK keeps the server from setting \Seen on the fetched messages. The body
+# is located through BODYSTRUCTURE and fetched as a single part afterwards.
+_HEADERS_QUERY = f"(BODY.PEEK[HEADER.FIELDS ({_METADATA_FIELDS})])"
+_HEADERS_AND_STRUCTURE_QUERY = (
+    f"(BODY.PEEK[HEADER.FIELDS ({_METADATA_FIELDS})] BODYSTRUCTURE)"
+)
+
+# Parsers are stateless between calls, so one instance of each is shared.
+# The default policy yields EmailMessage objects with decoded header values.
+_PARSER = BytesParser(policy=default_policy)
+_HEADER_PARSER = BytesHeaderParser(policy=default_policy)
+
+_FETCH_MSGNO_RE = re.compile(rb"^\d+ \(")
+_FETCH_TOKEN_RE = re.compile(
+    rb"""\s*(?:
+        (?P<open>\() | (?P<close>\)) |
+        "(?P<quoted>(?:[^"\\]|\\.)*)" |
+        \{(?P<literal>\d+)\}$ |
+        (?P<atom>[^\s()"{\[\]]+(?:\[[^\]]*\](?:<\d+>)?)?)
+    )""",
+    re.VERBOSE,
+)
+_QUOTED_ESCAPE_RE = re.compile(rb"\\(.)")
+
+FetchValue = Union[bytes, None, list]
+
+# Message ids as returned by search_emails (bytes) or given by callers
+EmailId = Union[int, bytes, str]
+
+
+def _tokenize_fetch(segments: List[Tuple[bytes, Optional[bytes]]]) -> list:
+    """Parse the segments of one FETCH response into nested lists.
+
+    Atoms and strings become bytes, NIL becomes None, parenthesized lists
+    become lists, and a ``{n}`` literal marker is replaced by its literal.
+    """
+    stack: List[list] = [[]]
+    for text, literal in segments:
+        pos = 0
+        while pos < len(text):
+            match = _FETCH_TOKEN_RE.match(text, pos)
+            if match is None or match.end() == pos:
+                if text[pos:].strip():
+                    raise ValueError(f"Unparseable FETCH response: {text!r}")
+                break
+            pos = match.end()
+            if match["open"]:
+                stack.append([])
+            elif match["close"]:
+                if len(stack) == 1:
+                    raise ValueError(f"Unbalanced FETCH response: {text!r}")
+                closed = stack.pop()
+                stack[-1].append(closed)
+            elif match["quoted"] is not None:
+                stack[-1].append(_QUOTED_ESCAPE_RE.sub(rb"\1", match["quoted"]))
+            elif match["literal"] is not None:
+                stack[-1].append(literal)
+            elif match["atom"].upper() == b"NIL":
+                stack[-1].append(None)
+            else:
+                stack[-1].append(match["atom"])
+    if len(stack) != 1:
+        raise ValueError("Unbalanced FETCH response")
+    return stack[0]
+
+
+def _parse_fetch_response(data: list) -> Dict[bytes, Dict[bytes, FetchValue]]:
+    """Parse an imaplib FETCH response into the data items of each message.
+
+    imaplib returns one ``(head, literal)`` tuple per literal and plain bytes
+    for the text between and after literals. A new message starts with its
+    id (``b"1 (UID 7 BODY[TEXT] {42}"``); its later parts start with a space
+    or the closing parenthesis.
+
+    Returns:
+        Mapping of message id to ``{item name: value}``, with item names as
+        sent by the server (``b"BODY[TEXT]"``, ``b"BODYSTRUCTURE"``).
+    """
+    responses: List[List[Tuple[bytes, Optional[bytes]]]] = []
+    for item in data:
+        if isinstance(item, tuple):
+            head, literal = item
+        else:
+            head, literal = item, None
+        if not isinstance(head, bytes):
+            continue
+        if _FETCH_MSGNO_RE.match(head) or not responses:
+            responses.append([])
+        responses[-1].append((head, literal))
+
+    messages: Dict[bytes, Dict[bytes, FetchValue]] = {}
+    for segments in responses:
+        tokens = _tokenize_fetch(segments)
+        if len(tokens) != 2 or not isinstance(tokens[1], list):
+            raise ValueError(f"Unexpected FETCH response: {segments!r}")
+        msg_id, items = tokens
+        message = messages.setdefault(msg_id, {})
+        for name, value in zip(items[::2], items[1::2]):
+            message[name.upper()] = value
+    return messages
+
+
+def _find_text_part(structure: list, section: str = "") -> Optional[Tuple[str, list]]:
+    """Locate the body text in a parsed BODYSTRUCTURE.
+
+    Mirrors _extract_text_body: the first inline text/plain part of a
+    multipart message, or the single part of any other message.
+
+    Returns:
+        The IMAP section number (``"1"``, ``"2.1"``) and the part's
+        structure, or None if the message has no text/plain part
+    """
+    if isinstance(structure[0], list):
+        # Child parts come first, followed by the subtype and extension data
+        children = takewhile(lambda child: isinstance(child, list), structure)
+        for index, child in enumerate(children, 1):
+            found = _find_text_part(
+                child, f"{section}.{index}" if section else str(index)
+            )
+            if found is not None:
+                return found
+        return None
+
+    content_type = (structure[0] + b"/" + structure[1]).lower()
+    if section:
+        if content_type != b"text/plain":
+            return None
+        disposition = structure[9] if len(structure) > 9 else None
+        if isinstance(disposition, list) and disposition[0].lower() == b"attachment":
+            return None
+    return section or "1", structure
+
+
+def _decode_part(payload: bytes, structure: list) -> str:
+    """Decode a part fetched with BODY[<section>] using its BODYSTRUCTURE."""
+    encoding = (structure[5] or b"7BIT").upper()
+    if encoding == b"BASE64":
+        try:
+            payload = base64.b64decode(payload)
+        except binascii.Error:
+            pass
+    elif encoding == b"QUOTED-PRINTABLE":
+        payload = quopri.decodestring(payload)
+
+    params = structure[2] or []
+    charset = next(
+        (
+            value.decode("ascii", "replace")
+            for key, value in zip(params[::2], params[1::2])
+            if key.lower() == b"charset" and value
+        ),
+        "utf-8",
+    )
+    try:
+        return payload.decode(charset, errors="replace")
+    except LookupError:
+        return payload.decode("utf-8", errors="replace")
+
+
+def _extract_text_body(msg: email.message.Message) -> str:
+    """Return the first text/plain part of a multipart message, else the payload."""
+    if msg.is_multipart():
+        if isinstance(msg, email.message.EmailMessage):
+            part = msg.get_body(preferencelist=("plain",))
+        else:
+            part = next(
+                (p for p in msg.walk() if p.get_content_type() == "text/plain"), None
+            )
+        if part is None:
+            return ""
+    else:
+        part = msg
+
+    payload = part.get_payload(decode=True)
+    if not isinstance(payload, bytes):
+        return str(payload)
+    try:
+        return payload.decode(part.get_content_charset() or "utf-8", errors="replace")
+    except LookupError:
+        return payload.decode("utf-8", errors="replace")
+
+
+# msg-id of RFC 5322 without comments or folding: <id-left@id-right>
+_MESSAGE_ID_RE = re.compile(r"<[^<>@\s]+@[^<>@\s]+>")
+
+
+def is_valid_message_id(message_id: str) -> bool:
+    """Check that a string is a single well-formed Message-ID."""
+    return _MESSAGE_ID_RE.fullmatch(message_id) is not None
+
+
+def _parse_metadata(header: bytes) -> Dict[str, str]:
+    """Build the metadata dict from the fetched header fields."""
+    email_message = _HEADER_PARSER.parsebytes(header)
+
+    # Header objects are converted to plain strings
+    return {
+        "subject": str(email_message.get("subject", "")),
+        "from": str(email_message.get("from", "")),
+        "to": str(email_message.get("to", "")),
+        "date": str(email_message.get("date", "")),
+        "message_id": str(email_message.get("Message-ID", "")),
+        "in_reply_to": str(email_message.get("In-Reply-To", "")),
+        "references": str(email_message.get("References", "")),
+    }
+
 
 class EmailClientProtocol(Protocol):
     """Protocol defining the interface for email client operations."""
@@ -44,22 +397,28 @@ class EmailClientProtocol(Protocol):
 
     def search_emails(
         self, mailbox: str = "INBOX", criteria: str = "UNSEEN"
-    ) -> List[int]: ...
+    ) -> List[bytes]: ...
 
     """Search emails in a mailbox."""
 
     def get_email_content(
-        self, email_id: int, mailbox: str = "INBOX"
+        self, email_id: EmailId, mailbox: str = "INBOX"
     ) -> Tuple[str, str]: ...
 
     """Get email subject and body."""
 
     def get_email_metadata(
-        self, email_id: int, mailbox: str = "INBOX"
+        self, email_id: EmailId, mailbox: str = "INBOX", with_body: bool = True
     ) -> Dict[str, str]: ...
 
     """Get email metadata including threading headers."""
 
+    def fetch_metadata_bulk(
+        self, email_ids: Sequence[bytes], mailbox: str = "INBOX", with_body: bool = True
+    ) -> List[Dict[str, str]]: ...
+
+    """Get metadata for several emails, in the order of email_ids."""
+
     def close(self) -> None: ...
 
     """Close the connection to the email server."""
@@ -70,6 +429,9 @@ class IMAPEmailClient:
 
     def __init__(self):
         self._imap: Union[imaplib.IMAP4, imaplib.IMAP4_SSL, None] = None
+        self._lock = threading.Lock()
+        self._last_used = 0.0
+        self._selected_mailbox: Optional[str] = None
 
     def __enter__(self) -> "IMAPEmailClient":
         """Context manager entry."""
@@ -80,47 +442,104 @@ class IMAPEmailClient:
         """Context manager exit."""
         self.close()
 
+    @contextmanager
+    def session(self) -> Iterator["IMAPEmailClient"]:
+        """Use the connection exclusively, keeping it open afterwards.
+
+        Connects lazily, probes a long idle connection with NOOP, and drops
+        the connection on socket errors so that the next session reconnects.
+        """
+        with self._lock:
+            self._ensure_connected()
+            try:
+                yield self
+            except imaplib.IMAP4.abort:
+                self._drop()
+                raise
+            except OSError as e:
+                # A plain ConnectionError is how this client reports NO
+                # replies; only socket and SSL errors break the connection
+                if type(e) is ConnectionError:
+                    self._selected_mailbox = None
+                else:
+                    self._drop()
+                raise
+            except Exception:
+                self._selected_mailbox = None
+                raise
+            finally:
+                self._last_used = time.monotonic()
+
+    def _ensure_connected(self) -> None:
+        """Connect unless an open and responsive connection exists."""
+        if (
+            self._imap is not None
+            and time.monotonic() - self._last_used > KEEPALIVE_INTERVAL
+        ):
+            try:
+                self._imap.noop()
+            except (imaplib.IMAP4.error, OSError):
+                self._drop()
+        if self._imap is None:
+            self.connect()
+
+    def _ensure_selected(self, mailbox: str) -> bool:
+        """Select ``mailbox`` unless it is still selected from an earlier call.
+
+        The mailbox is opened read-only (EXAMINE): the client only reads from
+        the selected mailbox, and APPEND names its target mailbox itself.
+
+        Returns:
+            True if the mailbox is selected
+        """
+        if mailbox == self._selected_mailbox:
+            return True
+        self._selected_mailbox = None
+        status, _ = self._imap.select(mailbox, readonly=True)
+        if status != "OK":
+            return False
+        self._selected_mailbox = mailbox
+        return True
+
+    def _drop(self) -> None:
+        """Discard a broken connection without talking to the server."""
+        self._selected_mailbox = None
+        if self._imap is not None:
+            try:
+                self._imap.shutdown()
+            except OSError:
+                pass
+            self._imap = None
+
     def connect(self) -> None:
         """Connect to the IMAP server."""
-        host = os.getenv("IMAP_HOST")
-        user = os.getenv("IMAP_USER")
-        password = os.getenv("IMAP_PASSWORD")
-        port = os.getenv("IMAP_PORT", "993")
-        use_ssl = os.getenv("IMAP_USE_SSL", "true")
-        use_starttls = os.getenv("IMAP_USE_STARTTLS", "false")
-        verify_ssl = os.getenv("IMAP_VERIFY_SSL", "true")
-
-        # Handle None values and convert to boolean
-        use_ssl = use_ssl.lower() == "true" if use_ssl else True
-        use_starttls = use_starttls.lower() == "true" if use_starttls else False
-        verify_ssl = verify_ssl.lower() == "true" if verify_ssl else True
+        config = _load_imap_config()
+        host, user, password = config.host, config.user, config.password
 
         if host is None or user is None or password is None:
             raise ValueError("IMAP configuration in .env incomplete")
 
         try:
             # Convert port to integer
-            port_int = int(port)
+            port_int = int(config.port)
 
-            # Create SSL context if needed
+            # Reuse the SSL context if needed
             ssl_context = None
-            if use_ssl or use_starttls:
-                ssl_context = ssl.create_default_context()
-                if not verify_ssl:
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
+            if config.use_ssl or config.use_starttls:
+                ssl_context = _ssl_context(config.verify_ssl)
 
             # Connect using appropriate method
-            if use_starttls:
+            if config.use_starttls:
                 # Use IMAP4 with STARTTLS
-                imap = imaplib.IMAP4(host, port_int)
+                imap = _IMAP4(host, port_int)
                 imap.starttls(ssl_context=ssl_context)
             else:
                 # Use IMAP4_SSL (direct SSL/TLS)
-                imap = imaplib.IMAP4_SSL(host, port_int, ssl_context=ssl_context)
+                imap = _IMAP4_SSL(host, port_int, ssl_context=ssl_context)
 
             imap.login(user, password)
             self._imap = imap
+            self._selected_mailbox = None
         except imaplib.IMAP4.error as e:
             raise ConnectionError(f"IMAP connection failed: {e}") from e
         except ValueError as e:
@@ -139,36 +558,21 @@ class IMAPEmailClient:
 
         try:
             # Get drafts folder from environment variable
-            drafts_folder = os.getenv("IMAP_DRAFT_FOLDER", "INBOX.Drafts")
-
-            # Ensure the folder exists
-            try:
-                status, _ = self._imap.select(drafts_folder)
-                if status != "OK":
-                    # Folder doesn't exist, try to create it
-                    status, _ = self._imap.create(drafts_folder)
-                    if status != "OK":
-                        logger.error(
-                            "Failed to create or access folder: %s", drafts_folder
-                        )
-                        return False
-                    # Successfully created, select it
-                    self._imap.select(drafts_folder)
-            except (ConnectionError, OSError) as e:
-                logger.error("Error ensuring folder exists: %s", e)
-                return False
-            except Exception as e:
-                logger.error("Unexpected error ensuring folder exists: %s", e)
-                return False
+            config = _load_imap_config()
+            drafts_folder = config.drafts_folder
 
             # Create the email
             message = email.message.EmailMessage()
-            from_address = os.getenv("IMAP_FROM", os.getenv("IMAP_USER"))
-            message["From"] = from_address
+            message["From"] = config.from_address
             message["To"] = to
             message["Subject"] = subject
 
             # Add email threading headers if provided
+            in_reply_to = in_reply_to.strip()
+            if in_reply_to and not is_valid_message_id(in_reply_to):
+                # Refuse rather than save a draft outside of its thread
+                logger.error("Malformed Message-ID in In-Reply-To: %r", in_reply_to)
+                return False
             if in_reply_to:
                 message["In-Reply-To"] = in_reply_to
                 # Generate References header for proper email threading
@@ -176,13 +580,17 @@ class IMAPEmailClient:
 
             message.set_content(body)
 
-            # Save the email
-            status, _ = self._imap.append(
-                drafts_folder,
-                "",
-                imaplib.Time2Internaldate(time.time()),
-                message.as_bytes(),
-            )
+            # Save the email; APPEND needs no SELECT of the drafts folder
+            date_time = imaplib.Time2Internaldate(time.time())
+            raw_message = message.as_bytes()
+            status, _ = self._imap.append(drafts_folder, "", date_time, raw_message)
+            if status != "OK":
+                # Folder doesn't exist, try to create it and append again
+                status, _ = self._imap.create(drafts_folder)
+                if status != "OK":
+                    logger.error("Failed to create or access folder: %s", drafts_folder)
+                    return False
+                status, _ = self._imap.append(drafts_folder, "", date_time, raw_message)
             return status == "OK"
 
         except (ConnectionError, OSError) as e:
@@ -194,121 +602,222 @@ class IMAPEmailClient:
 
     def search_emails(
         self, mailbox: str = "INBOX", criteria: str = "UNSEEN"
-    ) -> List[int]:
-        """Search emails in a mailbox."""
+    ) -> List[bytes]:
+        """Search emails in a mailbox.
+
+        Returns UIDs, which unlike sequence numbers stay valid when other
+        messages are expunged before they are fetched.
+        """
         if self._imap is None:
             raise ConnectionError("Not connected to email server")
 
-        status, messages = self._imap.select(mailbox)
-        if status != "OK":
+        if not self._ensure_selected(mailbox):
             raise ConnectionError(f"Cannot select mailbox {mailbox}")
 
-        status, email_ids = self._imap.search(None, criteria)
+        status, email_ids = self._imap.uid("SEARCH", *_encode_criteria(criteria))
         if status != "OK":
             raise ConnectionError("Email search failed")
 
         return email_ids[0].split()
 
     def get_email_content(
-        self, email_id: int, mailbox: str = "INBOX"
+        self, email_id: EmailId, mailbox: str = "INBOX"
     ) -> Tuple[str, str]:
-        """Get email subject and body."""
-        if self._imap is None:
-            raise ConnectionError("Not connected to email server")
-
-        status, data = self._imap.fetch(str(email_id), "(RFC822)")
-        if status != "OK":
-            raise ConnectionError(f"Cannot retrieve email {email_id}")
-
-        # Type safety: Ensure data has the expected structure
-        if not data or not data[0] or len(data[0]) < 2:
-            raise ConnectionError(f"Invalid email data structure for email {email_id}")
-
-        raw_email = data[0][1]
-        if not isinstance(raw_email, bytes):
-            raise ConnectionError(
-                f"Expected bytes for email data, got {type(raw_email)}"
-            )
+        """Get email subject and body.
 
-        email_message = email.message_from_bytes(raw_email)
-
-        subject = email_message.get("subject", "")
-        body = ""
-
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    body = (
-                        payload.decode() if isinstance(payload, bytes) else str(payload)
-                    )
-                    break
-        else:
-            payload = email_message.get_payload(decode=True)
-            body = payload.decode() if isinstance(payload, bytes) else str(payload)
-
-        return subject, body
+        Only the header fields and the text part are transferred, never the
+        attachments.
+        """
+        metadata = self.get_email_metadata(email_id, mailbox)
+        return metadata["subject"], metadata["body"]
 
     def get_email_metadata(
-        self, email_id: int, mailbox: str = "INBOX"
+        self, email_id: EmailId, mailbox: str = "INBOX", with_body: bool = True
     ) -> Dict[str, str]:
-        """Get email metadata including threading headers."""
+        """Get email metadata including threading headers.
+
+        Only the needed header fields are fetched; the text part of the
+        message is fetched as well when ``with_body`` is set.
+        """
+        if not isinstance(email_id, bytes):
+            email_id = str(email_id).encode()
+        return self.fetch_metadata_bulk([email_id], mailbox, with_body=with_body)[0]
+
+    def fetch_metadata_bulk(
+        self,
+        email_ids: Sequence[bytes],
+        mailbox: str = "INBOX",
+        with_body: bool = True,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> List[Dict[str, str]]:
+        """Get metadata for several emails with one FETCH per batch of ids.
+
+        Results are returned in the order of ``email_ids``.
+        """
         if self._imap is None:
             raise ConnectionError("Not connected to email server")
 
-        status, data = self._imap.fetch(str(email_id), "(RFC822)")
-        if status != "OK":
-            raise ConnectionError(f"Cannot retrieve email {email_id}")
+        if not self._ensure_selected(mailbox):
+            raise ConnectionError(f"Cannot select mailbox {mailbox}")
 
-        # Type safety: Ensure data has the expected structure
-        if not data or not data[0] or len(data[0]) < 2:
-            raise ConnectionError(f"Invalid email data structure for email {email_id}")
+        query = _HEADERS_AND_STRUCTURE_QUERY if with_body else _HEADERS_QUERY
+        messages = self._fetch(email_ids, query, batch_size)
 
-        raw_email = data[0][1]
-        if not isinstance(raw_email, bytes):
+        result = []
+        for email_id in email_ids:
+            items = messages.get(email_id, {})
+            header = next(
+                (v for k, v in items.items() if k.startswith(b"BODY[HEADER")), None
+            )
+            if header is None:
+                raise ConnectionError(f"Cannot retrieve email {email_id.decode()}")
+            result.append(_parse_metadata(header))
+
+        if with_body:
+            structures = {
+                email_id: messages[email_id].get(b"BODYSTRUCTURE")
+                for email_id in email_ids
+            }
+            bodies = self._fetch_bodies(structures, batch_size)
+            for email_id, metadata in zip(email_ids, result):
+                metadata["body"] = bodies[email_id]
+
+        return result
+
+    def _fetch(
+        self,
+        email_ids: Sequence[bytes],
+        query: str,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Dict[bytes, Dict[bytes, FetchValue]]:
+        """Run UID FETCH for ``email_ids`` in batches and parse the responses.
+
+        Returns:
+            Mapping of UID to the data items fetched for that message
+        """
+        message_sets = [
+            b",".join(email_ids[start : start + batch_size])
+            for start in range(0, len(email_ids), batch_size)
+        ]
+        data = self._pipelined_fetch(message_sets, query)
+        try:
+            responses = _parse_fetch_response(data)
+        except ValueError as e:
+            raise ConnectionError(f"Invalid FETCH response: {e}") from e
+
+        # Responses are keyed by sequence number; unsolicited ones lack a UID
+        messages: Dict[bytes, Dict[bytes, FetchValue]] = {}
+        for items in responses.values():
+            uid = items.get(b"UID")
+            if uid is not None:
+                messages[uid] = items
+        return messages
+
+    def _pipelined_fetch(self, message_sets: List[bytes], query: str) -> list:
+        """Send one UID FETCH per message set back to back and collect the data.
+
+        imaplib's public fetch() waits for each command to complete before the
+        next one is sent. This uses its private ``_command`` (send a command,
+        return its tag) and ``_command_complete`` (read responses up to that
+        tag) to keep up to FETCH_PIPELINE_DEPTH commands in flight. The
+        untagged FETCH data of all commands accumulates in imaplib and is
+        returned in the shape fetch() returns it.
+        """
+        imap = self._imap
+        pending: Deque[Tuple[bytes, bytes]] = deque()
+        failed: List[bytes] = []
+        errors: List[imaplib.IMAP4.error] = []
+
+        def complete_oldest() -> None:
+            message_set, tag = pending.popleft()
+            try:
+                status, _ = imap._command_complete("UID", tag)
+            except imaplib.IMAP4.abort:
+                # The connection is gone; session() discards it
+                raise
+            except imaplib.IMAP4.error as e:
+                # BAD reply; the remaining tags must still be read
+                errors.append(e)
+                status = "BAD"
+            if status != "OK":
+                failed.append(message_set)
+
+        for message_set in message_sets:
+            if len(pending) >= FETCH_PIPELINE_DEPTH:
+                complete_oldest()
+            pending.append(
+                (message_set, imap._command("UID", "FETCH", message_set, query))
+            )
+        # Read every outstanding response before reporting a failure, so that
+        # no stale FETCH data is left for the next command
+        while pending:
+            complete_oldest()
+
+        _, data = imap._untagged_response("OK", [None], "FETCH")
+        if errors:
+            raise errors[0]
+        if failed:
             raise ConnectionError(
-                f"Expected bytes for email data, got {type(raw_email)}"
+                f"Cannot retrieve emails {b','.join(failed).decode()}"
             )
+        return data
+
+    def _fetch_bodies(
+        self,
+        structures: Dict[bytes, FetchValue],
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Dict[bytes, str]:
+        """Fetch and decode only the text part of each message.
+
+        Messages are grouped by the section number of their text part, so each
+        distinct section costs one FETCH. A message whose BODYSTRUCTURE cannot
+        be read is fetched in full instead.
+        """
+        bodies: Dict[bytes, str] = {}
+        by_section: Dict[str, List[Tuple[bytes, list]]] = {}
+        unstructured: List[bytes] = []
+        for email_id, structure in structures.items():
+            try:
+                found = _find_text_part(structure)
+            except (AttributeError, IndexError, TypeError):
+                unstructured.append(email_id)
+                continue
+            if found is None:
+                bodies[email_id] = ""
+            else:
+                section, part = found
+                by_section.setdefault(section, []).append((email_id, part))
+
+        for section, parts in by_section.items():
+            messages = self._fetch(
+                [email_id for email_id, _ in parts],
+                f"(BODY.PEEK[{section}])",
+                batch_size,
+            )
+            item = f"BODY[{section}]".encode()
+            for email_id, part in parts:
+                payload = messages.get(email_id, {}).get(item)
+                bodies[email_id] = _decode_part(payload or b"", part)
 
-        email_message = email.message_from_bytes(raw_email)
-
-        # Extract metadata
-        metadata = {
-            "subject": email_message.get("subject", ""),
-            "from": email_message.get("from", ""),
-            "to": email_message.get("to", ""),
-            "date": email_message.get("date", ""),
-            "message_id": email_message.get("Message-ID", ""),
-            "in_reply_to": email_message.get("In-Reply-To", ""),
-            "references": email_message.get("References", ""),
-        }
-
-        # Extract body content
-        body = ""
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    body = (
-                        payload.decode() if isinstance(payload, bytes) else str(payload)
-                    )
-                    break
-        else:
-            payload = email_message.get_payload(decode=True)
-            body = payload.decode() if isinstance(payload, bytes) else str(payload)
-
-        metadata["body"] = body
+        if unstructured:
+            messages = self._fetch(unstructured, "(BODY.PEEK[])", batch_size)
+            for email_id in unstructured:
+                raw_email = messages.get(email_id, {}).get(b"BODY[]")
+                email_message = _PARSER.parsebytes(raw_email or b"")
+                bodies[email_id] = _extract_text_body(email_message)
 
-        return metadata
+        return bodies
 
     def close(self) -> None:
         """Close the IMAP connection."""
         if self._imap is not None:
             try:
-                self._imap.close()
+                # CLOSE is only valid with a selected mailbox; save_draft
+                # appends without selecting one
+                if self._imap.state == "SELECTED":
+                    self._imap.close()
                 self._imap.logout()
-            except (ConnectionError, OSError):
+            except (imaplib.IMAP4.error, ConnectionError, OSError):
                 pass
             self._imap = None
+            self._selected_mailbox = None
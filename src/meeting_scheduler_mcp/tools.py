@@ -3,21 +3,95 @@ MCP tool implementations for the meeting scheduler.
 This module contains the business logic for all MCP tools.
 """
 
+import asyncio
 import logging
+import threading
 from typing import Annotated, Dict, List
 
 from pydantic import Field
 
 from .calendar import CalendarManager
-from .mail import IMAPEmailClient
+from .mail import (
+    IMAPConfig,
+    IMAPEmailClient,
+    _load_imap_config,
+    is_valid_message_id,
+)
 
 logger = logging.getLogger(__name__)
 
-# Initialize Calendar Manager
-calendar_manager = CalendarManager()
+# Calendar Manager, created by the first tool call that needs it so that
+# importing this module does not write calendar.yaml
+calendar_manager: CalendarManager | None = None
+_calendar_manager_lock = threading.Lock()
 
+# IMAP connections kept open across tool calls, keyed by the IMAP config
+# they connect with
+_email_clients: Dict[IMAPConfig, IMAPEmailClient] = {}
+_email_clients_lock = threading.Lock()
 
-def search_emails(
+
+def get_calendar_manager() -> CalendarManager:
+    """Return the calendar manager of the tools, creating it on first use."""
+    global calendar_manager
+    with _calendar_manager_lock:
+        if calendar_manager is None:
+            calendar_manager = CalendarManager()
+        return calendar_manager
+
+
+def get_shared_client() -> IMAPEmailClient:
+    """Return the shared IMAP client for the configured account.
+
+    Use it through ``client.session()``, which connects on demand and keeps
+    the connection open for the next call.
+    """
+    # The same cached config connect() reads, so the key cannot go stale
+    key = _load_imap_config()
+    with _email_clients_lock:
+        client = _email_clients.get(key)
+        if client is None:
+            client = _email_clients[key] = IMAPEmailClient()
+    return client
+
+
+def _search_emails_internal(
+    mailbox: str = "INBOX", criteria: str = "UNSEEN"
+) -> List[Dict[str, str]] | Dict[str, str]:
+    """Blocking implementation of search_emails.
+
+    Args:
+        mailbox: Mailbox name to search in
+        criteria: IMAP search criteria
+
+    Returns:
+        List of email metadata dicts, or a dict with an error message
+    """
+    try:
+        with get_shared_client().session() as client:
+            email_ids = client.search_emails(mailbox, criteria)
+
+            # Fetch full metadata including threading information in bulk;
+            # the dicts already have the shape of the tool result
+            result = client.fetch_metadata_bulk(email_ids, mailbox)
+
+        for metadata, email_id in zip(result, email_ids):
+            # Convert email_id to string for consistent return format
+            metadata["id"] = (
+                email_id.decode() if isinstance(email_id, bytes) else str(email_id)
+            )
+
+        return result
+
+    except (ConnectionError, OSError) as e:
+        logger.error("Failed to search emails: %s", e)
+        return {"error": f"Email search failed: {e}"}
+    except Exception as e:
+        logger.error("Unexpected error searching emails: %s", e)
+        return {"error": f"Unexpected error: {e}"}
+
+
+async def search_emails(
     mailbox: Annotated[
         str,
         Field(
@@ -32,48 +106,14 @@ def search_emails(
     ] = "UNSEEN",
 ) -> List[Dict[str, str]] | Dict[str, str]:
     """Search emails with full metadata including Message-ID, In-Reply-To, and References headers for email threading. Find meeting requests, track conversations, and maintain context across email exchanges. Supports custom mailboxes and flexible IMAP search criteria. Returns comprehensive email data with subject, sender, recipient, date, and body content."""
-    try:
-        with IMAPEmailClient() as client:
-            email_ids = client.search_emails(mailbox, criteria)
-
-            result = []
-            for email_id in email_ids:
-                # Get full email metadata including threading information
-                metadata = client.get_email_metadata(int(email_id), mailbox)
-
-                # Convert email_id to string for consistent return format
-                email_id_str = (
-                    email_id.decode() if isinstance(email_id, bytes) else str(email_id)
-                )
-
-                result.append(
-                    {
-                        "id": email_id_str,
-                        "subject": metadata.get("subject", ""),
-                        "from": metadata.get("from", ""),
-                        "to": metadata.get("to", ""),
-                        "date": metadata.get("date", ""),
-                        "message_id": metadata.get("message_id", ""),
-                        "in_reply_to": metadata.get("in_reply_to", ""),
-                        "references": metadata.get("references", ""),
-                        "body": metadata.get("body", ""),
-                    }
-                )
-
-        return result
-
-    except (ConnectionError, OSError) as e:
-        logger.error("Failed to search emails: %s", e)
-        return {"error": f"Email search failed: {e}"}
-    except Exception as e:
-        logger.error("Unexpected error searching emails: %s", e)
-        return {"error": f"Unexpected error: {e}"}
+    # IMAP calls block, so keep them off the event loop serving other requests
+    return await asyncio.to_thread(_search_emails_internal, mailbox, criteria)
 
 
 def get_free_slots() -> List[Dict[str, str]] | Dict[str, str]:
     """Get up to 50 available time slots from your calendar with timezone information. Uses intelligent slot finding with holiday awareness, minimum notice period validation (2 hours), and automatic filtering of blocked/past slots. Perfect for finding meeting times and managing your schedule. Returns slots in ISO 8601 format with date, start, end, and timezone."""
     try:
-        free_slots = calendar_manager.get_free_slots()
+        free_slots = get_calendar_manager().get_free_slots()
         return [slot.to_dict() for slot in free_slots]
     except FileNotFoundError as e:
         logger.error("Calendar file not found: %s", e)
@@ -108,8 +148,17 @@ def _save_draft_and_block_slot_internal(
     Returns:
         Dict with success status
     """
+    # Checked before the slot is blocked, so a bad value changes nothing
+    in_reply_to = in_reply_to.strip()
+    if in_reply_to and not is_valid_message_id(in_reply_to):
+        logger.error("Malformed Message-ID in in_reply_to: %r", in_reply_to)
+        return {
+            "error": f"Invalid in_reply_to Message-ID: {in_reply_to!r}",
+            "success": False,
+        }
+
     try:
-        success = calendar_manager.save_draft_and_block_slot(
+        success = get_calendar_manager().save_draft_and_block_slot(
             datetime,
             duration,
             reason,
@@ -128,7 +177,7 @@ def _save_draft_and_block_slot_internal(
         return {"error": f"Unexpected error: {e}", "success": False}
 
 
-def save_draft_and_block_slot(
+async def save_draft_and_block_slot(
     datetime: Annotated[
         str,
         Field(
@@ -170,14 +219,21 @@ def save_draft_and_block_slot(
     in_reply_to: Annotated[
         str,
         Field(
-            description="Optional Message-ID of the email this is replying to, for maintaining email conversation threads. Format: <original-message-id@example.com>. Examples: <CA+123456789@example.com>, <meeting-request-123@mail.server.com>. When provided, this creates a proper email thread by setting In-Reply-To and References headers",
+            description="Optional Message-ID of the email this is replying to, for maintaining email conversation threads. Format: <original-message-id@example.com>. Examples: <CA+123456789@example.com>, <meeting-request-123@mail.server.com>. When provided, this creates a proper email thread by setting In-Reply-To and References headers. A malformed value is rejected with an error and nothing is saved",
             default="",
         ),
     ] = "",
 ) -> Dict[str, str | bool]:
     """Complete meeting scheduling workflow: atomically block a calendar slot AND save a confirmation email as a draft. Supports email threading with In-Reply-To headers for maintaining conversation context. Requires ISO 8601 datetime with timezone, duration in minutes, and email content. Returns success status with error handling. Perfect for confirming meetings naturally while maintaining proper email threading."""
-    return _save_draft_and_block_slot_internal(
-        datetime, duration, reason, subject, body, to, in_reply_to=in_reply_to
+    return await asyncio.to_thread(
+        _save_draft_and_block_slot_internal,
+        datetime,
+        duration,
+        reason,
+        subject,
+        body,
+        to,
+        in_reply_to=in_reply_to,
     )
 
 
@@ -185,5 +241,6 @@ __all__ = [
     "search_emails",
     "get_free_slots",
     "save_draft_and_block_slot",
+    "_search_emails_internal",
     "_save_draft_and_block_slot_internal",
 ]
@@ -2,12 +2,14 @@
 Pytest fixtures for integration tests.
 """
 
+from collections import defaultdict
 from datetime import datetime, time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import pytest
 
+from meeting_scheduler_mcp import calendar as calendar_module
 from meeting_scheduler_mcp.calendar import (
     BlockedTime,
     Calendar,
@@ -25,6 +27,8 @@ class MockEmailClient:
     def __init__(self):
         self._connected = False
         self._emails: Dict[int, Dict[str, str]] = {}  # email_id -> email data
+        self._by_recipient: Dict[str, List[int]] = defaultdict(list)
+        self._subjects: List[Tuple[int, str]] = []  # (email_id, subject)
         self._next_email_id = 1
 
     def __enter__(self) -> "MockEmailClient":
@@ -60,6 +64,8 @@ class MockEmailClient:
             "in_reply_to": in_reply_to,
             "references": in_reply_to,
         }
+        self._by_recipient[to].append(email_id)
+        self._subjects.append((email_id, subject))
         return True
 
     def search_emails(
@@ -73,12 +79,13 @@ class MockEmailClient:
         return [str(email_id).encode() for email_id in self._emails.keys()]
 
     def get_email_content(
-        self, email_id: int, mailbox: str = "INBOX"
+        self, email_id: int | bytes | str, mailbox: str = "INBOX"
     ) -> Tuple[str, str]:
         """Get email subject and body (mock)."""
         if not self._connected:
             raise ConnectionError("Not connected to email server")
 
+        email_id = int(email_id)
         if email_id not in self._emails:
             raise ConnectionError(f"Email {email_id} not found")
 
@@ -86,16 +93,29 @@ class MockEmailClient:
         return email["subject"], email["body"]
 
     def get_email_metadata(
-        self, email_id: int, mailbox: str = "INBOX"
+        self, email_id: int | bytes | str, mailbox: str = "INBOX", with_body: bool = True
     ) -> Dict[str, str]:
         """Get email metadata including threading headers (mock)."""
         if not self._connected:
             raise ConnectionError("Not connected to email server")
 
+        email_id = int(email_id)
         if email_id not in self._emails:
             raise ConnectionError(f"Email {email_id} not found")
 
-        return self._emails[email_id].copy()
+        metadata = self._emails[email_id].copy()
+        if not with_body:
+            del metadata["body"]
+        return metadata
+
+    def fetch_metadata_bulk(
+        self, email_ids: List[bytes], mailbox: str = "INBOX", with_body: bool = True
+    ) -> List[Dict[str, str]]:
+        """Get metadata for several emails (mock)."""
+        return [
+            self.get_email_metadata(email_id, mailbox, with_body=with_body)
+            for email_id in email_ids
+        ]
 
     def close(self) -> None:
         """Close the connection to the email server (mock)."""
@@ -116,15 +136,17 @@ class MockEmailClient:
 
     def _find_drafts_to(self, recipient: str) -> List[Dict[str, str]]:
         """Find all drafts to a specific recipient for test assertions."""
-        return [e for e in self._emails.values() if e["to"] == recipient]
+        return [self._emails[i] for i in self._by_recipient.get(recipient, [])]
 
     def _find_drafts_with_subject(self, subject: str) -> List[Dict[str, str]]:
         """Find all drafts with a specific subject for test assertions."""
-        return [e for e in self._emails.values() if subject in e["subject"]]
+        return [self._emails[i] for i, s in self._subjects if subject in s]
 
     def _clear(self) -> None:
         """Clear all emails for test cleanup."""
         self._emails.clear()
+        self._by_recipient.clear()
+        self._subjects.clear()
         self._next_email_id = 1
 
 
@@ -139,25 +161,102 @@ def mock_email_client() -> MockEmailClient:
 
 
 @pytest.fixture
-def temp_calendar(tmp_path: Path) -> Tuple[Path, CalendarManager]:
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], None]:
+    """Fixture fixing the calendar module's clock to an ISO 8601 timestamp.
+
+    Unlike freezegun only ``meeting_scheduler_mcp.calendar._now`` is replaced,
+    so the rest of the standard library keeps the real time.
+
+    Returns:
+        Callable[[str], None]: Sets the current time, may be called repeatedly
+    """
+
+    def freeze(timestamp: str) -> None:
+        now = datetime.fromisoformat(timestamp)
+        monkeypatch.setattr(calendar_module, "_now", lambda tz: now.astimezone(tz))
+
+    return freeze
+
+
+@pytest.fixture(scope="session")
+def default_calendar(tmp_path_factory: pytest.TempPathFactory) -> Calendar:
+    """Fixture providing the calendar a new CalendarManager writes, built once.
+
+    Returns:
+        Calendar: The parsed default calendar. Tests must not mutate it.
+    """
+    calendar_path = tmp_path_factory.mktemp("calendar") / "default_calendar.yaml"
+    return CalendarManager(str(calendar_path)).calendar_store.load()
+
+
+@pytest.fixture
+def temp_calendar(
+    tmp_path: Path, default_calendar: Calendar
+) -> Tuple[Path, CalendarManager]:
     """Fixture providing a temporary calendar YAML file and CalendarManager instance.
 
     Args:
         tmp_path: pytest's built-in tmp_path fixture
+        default_calendar: The session's default calendar
 
     Returns:
         Tuple[Path, CalendarManager]: Tuple containing the path to the temporary
         calendar file and a configured CalendarManager instance
     """
-    # Create a temporary calendar file
     calendar_path = tmp_path / "test_calendar.yaml"
 
-    # Create CalendarManager with the temporary file
-    calendar_manager = CalendarManager(str(calendar_path))
+    # Start from the session's default calendar with a blocked list of its own
+    calendar_manager = CalendarManager.from_calendar(
+        default_calendar.model_copy(update={"blocked": []}), str(calendar_path)
+    )
 
     return calendar_path, calendar_manager
 
 
+@pytest.fixture
+def tools_calendar(
+    temp_calendar: Tuple[Path, CalendarManager], monkeypatch: pytest.MonkeyPatch
+) -> CalendarManager:
+    """Fixture pointing the MCP tools at a temporary calendar.
+
+    Without it the tools block slots in the calendar.yaml of the working
+    directory, which is shared between test runs and parallel workers.
+
+    Returns:
+        CalendarManager: The manager the tools now use
+    """
+    from meeting_scheduler_mcp import tools
+
+    _, calendar_manager = temp_calendar
+    monkeypatch.setattr(tools, "calendar_manager", calendar_manager)
+    return calendar_manager
+
+
+# Default calendar for InMemoryCalendarStore, built once. Stores share its
+# schedule and only get their own blocked list, which is cheaper than both
+# re-validating the models and deep-copying them.
+_DEFAULT_CALENDAR_TEMPLATE = Calendar(
+    schedule=Schedule(
+        timezone="Europe/Berlin",
+        slot_duration=30,
+        holidays="DE",
+        weekly=[
+            WeeklyAvailability(
+                days=[
+                    Weekday.MON,
+                    Weekday.TUE,
+                    Weekday.WED,
+                    Weekday.THU,
+                    Weekday.FRI,
+                ],
+                slots=[TimeSlot(start=time(9, 0), end=time(17, 0))],
+            )
+        ],
+    ),
+    blocked=[],
+)
+
+
 class InMemoryCalendarStore:
     """In-memory calendar store for testing without file I/O.
 
@@ -173,25 +272,8 @@ class InMemoryCalendarStore:
                 a default calendar with Mon-Fri 09:00-17:00 availability
                 in Europe/Berlin timezone with German holidays.
         """
-        self._calendar = calendar or Calendar(
-            schedule=Schedule(
-                timezone="Europe/Berlin",
-                slot_duration=30,
-                holidays="DE",
-                weekly=[
-                    WeeklyAvailability(
-                        days=[
-                            Weekday.MON,
-                            Weekday.TUE,
-                            Weekday.WED,
-                            Weekday.THU,
-                            Weekday.FRI,
-                        ],
-                        slots=[TimeSlot(start=time(9, 0), end=time(17, 0))],
-                    )
-                ],
-            ),
-            blocked=[],
+        self._calendar = calendar or _DEFAULT_CALENDAR_TEMPLATE.model_copy(
+            update={"blocked": []}
         )
 
     def load(self) -> Calendar:
@@ -3,8 +3,8 @@ Test cases for calendar_manager.py
 """
 
 import pytest
-from freezegun import freeze_time
 
+from meeting_scheduler_mcp.calendar import CalendarManager, get_tz
 from tests.conftest import MockEmailClient
 
 
@@ -17,6 +17,16 @@ class TestCalendarManager:
         assert cm is not None
         assert cm.file_path.name == "test_calendar.yaml"
 
+    def test_from_calendar(self, tmp_path, default_calendar):
+        """Test that a manager can start from an already parsed calendar."""
+        calendar_path = tmp_path / "calendar.yaml"
+
+        cm = CalendarManager.from_calendar(default_calendar, str(calendar_path))
+
+        assert calendar_path.exists()
+        assert cm.calendar_store.load() is default_calendar
+        assert CalendarManager(str(calendar_path)).calendar_store.load() == default_calendar
+
     def test_get_free_slots(self, temp_calendar):
         """Test getting free (unblocked) slots using PRD system."""
         calendar_path, cm = temp_calendar
@@ -33,28 +43,61 @@ class TestCalendarManager:
             assert hasattr(slot, "end_time")
             assert hasattr(slot, "timezone")
 
+    def test_iter_free_slots_matches_get_free_slots(self, temp_calendar, frozen_now):
+        """Test that free slots can be consumed lazily and limited."""
+        frozen_now("2025-01-06T08:00:00+01:00")
+        calendar_path, cm = temp_calendar
+
+        slots = cm.iter_free_slots()
+        first_three = [next(slots) for _ in range(3)]
+
+        assert cm.get_free_slots(limit=3) == first_three
+        assert cm.get_free_slots()[:3] == first_three
+        assert len(cm.get_free_slots(limit=60)) == 60
+
+    def test_slot_finder_reused_until_calendar_changes(
+        self, temp_calendar, mock_email_client: MockEmailClient
+    ):
+        """Test that the parsed slot finder is kept while the file is unchanged."""
+        calendar_path, cm = temp_calendar
+
+        finder = cm._get_slot_finder()
+        assert cm._get_slot_finder() is finder
+
+        cm.save_draft_and_block_slot(
+            datetime_str="2025-12-15T14:00:00+01:00",
+            duration=60,
+            reason="Meeting",
+            subject="Test Meeting",
+            body="Test body",
+            to="test@example.com",
+            email_client=mock_email_client,
+        )
+
+        new_finder = cm._get_slot_finder()
+        assert new_finder is not finder
+        assert len(new_finder.calendar.blocked) == 1
+
     def test_save_draft_and_block_slot(
         self, temp_calendar, mock_email_client: MockEmailClient
     ):
         """Test blocking a slot and saving email draft."""
         from datetime import datetime
-        from zoneinfo import ZoneInfo
 
         calendar_path, cm = temp_calendar
 
-        # Get free slots first
-        free_slots = cm.get_free_slots()
-        if not free_slots:
+        # Get the first free slot
+        slot = next(cm.iter_free_slots(), None)
+        if slot is None:
             pytest.skip("No free slots available for testing")
 
         # Block the first slot using the new API with mock email client
-        slot = free_slots[0]
         # Create a datetime for the slot
         slot_start = datetime.combine(
-            slot.date, slot.start_time, tzinfo=ZoneInfo(slot.timezone)
+            slot.date, slot.start_time, tzinfo=get_tz(slot.timezone)
         )
         slot_end = datetime.combine(
-            slot.date, slot.end_time, tzinfo=ZoneInfo(slot.timezone)
+            slot.date, slot.end_time, tzinfo=get_tz(slot.timezone)
         )
         duration = int((slot_end - slot_start).total_seconds() / 60)
 
@@ -80,9 +123,9 @@ class TestCalendarManager:
         assert draft["body"] == "Test body"
         assert draft["to"] == "test@example.com"
 
-    @freeze_time("2023-12-15 08:00:00", tz_offset=1)
-    def test_free_slots_with_weekly_pattern(self, temp_calendar):
+    def test_free_slots_with_weekly_pattern(self, temp_calendar, frozen_now):
         """Test that free slots respect weekly availability patterns."""
+        frozen_now("2023-12-15T08:00:00+01:00")
         calendar_path, cm = temp_calendar
 
         # Friday should have slots (9-12, 13-17)
@@ -100,9 +143,9 @@ class TestCalendarManager:
                     f"Slot at {slot_hour}:00 outside configured hours"
                 )
 
-    @freeze_time("2023-12-16 08:00:00", tz_offset=1)  # Saturday
-    def test_no_slots_on_weekend(self, temp_calendar):
+    def test_no_slots_on_weekend(self, temp_calendar, frozen_now):
         """Test that no slots are available on weekends."""
+        frozen_now("2023-12-16T08:00:00+01:00")  # Saturday
         calendar_path, cm = temp_calendar
 
         free_slots = cm.get_free_slots()
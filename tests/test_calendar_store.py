@@ -0,0 +1,149 @@
+"""
+Test cases for calendar store.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from meeting_scheduler_mcp import calendar as calendar_module
+from meeting_scheduler_mcp.calendar import CalendarManager, CalendarStore
+
+
+@pytest.fixture
+def store(tmp_path) -> CalendarStore:
+    """Store backed by a freshly created default calendar."""
+    path = tmp_path / "calendar.yaml"
+    CalendarManager(str(path))
+    return CalendarStore(path)
+
+
+class TestCalendarStoreCache:
+    def test_unchanged_file_returns_cached_calendar(self, store):
+        assert store.load() is store.load()
+
+    def test_modified_file_is_reparsed(self, store):
+        first = store.load()
+
+        text = store.path.read_text().replace("slot_duration: 30", "slot_duration: 45")
+        store.path.write_text(text)
+        st = store.path.stat()
+        os.utime(store.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = store.load()
+        assert second is not first
+        assert second.schedule.slot_duration == 45
+
+    def test_add_blocked_does_not_mutate_cached_calendar(self, store):
+        before = store.load()
+
+        store.add_blocked(
+            datetime(2025, 1, 6, 10, 0, tzinfo=ZoneInfo("Europe/Berlin")),
+            duration=60,
+            reason="Meeting",
+        )
+
+        assert before.blocked == []
+        assert len(store.load().blocked) == 1
+
+    def test_add_blocked_does_not_reparse(self, store, mocker):
+        store.load()
+        yaml_load = mocker.patch("yaml.load")
+        validate_json = mocker.spy(
+            calendar_module._CalendarSidecar, "model_validate_json"
+        )
+
+        store.add_blocked(
+            datetime(2025, 1, 6, 10, 0, tzinfo=ZoneInfo("Europe/Berlin")),
+            duration=60,
+        )
+
+        assert len(store.load().blocked) == 1
+        yaml_load.assert_not_called()
+        validate_json.assert_not_called()
+
+    def test_concurrent_add_blocked_keeps_every_block(self, store):
+        start = datetime(2025, 1, 6, 10, 0, tzinfo=ZoneInfo("Europe/Berlin"))
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [
+                executor.submit(
+                    store.add_blocked, start + timedelta(hours=i), duration=60
+                )
+                for i in range(20)
+            ]
+            for future in futures:
+                future.result()
+
+        assert len(store.load().blocked) == 20
+        assert len(CalendarStore(store.path).load().blocked) == 20
+
+
+class TestCalendarStoreSidecar:
+    def test_fresh_store_loads_from_sidecar(self, store, mocker):
+        yaml_load = mocker.patch("yaml.load")
+
+        calendar = CalendarStore(store.path).load()
+
+        yaml_load.assert_not_called()
+        assert calendar.schedule.timezone == "Europe/Berlin"
+
+    def test_sidecar_ignored_after_yaml_edit(self, store):
+        text = store.path.read_text().replace("slot_duration: 30", "slot_duration: 45")
+        store.path.write_text(text)
+
+        assert CalendarStore(store.path).load().schedule.slot_duration == 45
+
+    def test_corrupt_sidecar_falls_back_to_yaml(self, store):
+        store.sidecar_path.write_text("{")
+
+        assert CalendarStore(store.path).load().schedule.slot_duration == 30
+
+
+class TestCalendarStoreSave:
+    def test_save_replaces_file_without_leftovers(self, store):
+        calendar = store.load()
+
+        store.save(calendar.model_copy(update={"blocked": []}))
+
+        assert {p.name for p in store.path.parent.iterdir()} == {
+            store.path.name,
+            store.sidecar_path.name,
+        }
+        assert store.load().schedule == calendar.schedule
+
+    def test_failed_save_keeps_previous_file(self, store, mocker):
+        original = store.path.read_bytes()
+        before = set(store.path.parent.iterdir())
+        mocker.patch(
+            "meeting_scheduler_mcp.calendar.os.replace", side_effect=OSError("disk")
+        )
+
+        with pytest.raises(OSError):
+            store.save(store.load())
+
+        assert store.path.read_bytes() == original
+        assert set(store.path.parent.iterdir()) == before
+
+    def test_concurrent_writes_use_separate_temp_files(self, store, mocker):
+        replace = mocker.patch("meeting_scheduler_mcp.calendar.os.replace")
+
+        calendar_module._write_atomic(store.path, b"first")
+        calendar_module._write_atomic(store.path, b"second")
+
+        (first, _), (second, _) = (call.args for call in replace.call_args_list)
+        assert first != second
+        assert Path(first).parent == store.path.parent
+        assert Path(first).read_bytes() == b"first"
+        assert Path(second).read_bytes() == b"second"
+
+    def test_save_keeps_file_mode(self, store):
+        store.path.chmod(0o640)
+
+        store.save(store.load())
+
+        assert store.path.stat().st_mode & 0o777 == 0o640
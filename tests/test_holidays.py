@@ -3,14 +3,16 @@ Test cases for holiday service.
 """
 
 from datetime import date
-from freezegun import freeze_time
 
-from meeting_scheduler_mcp.holidays import HolidayChecker
+from meeting_scheduler_mcp.holidays import (
+    HolidayChecker,
+    _easter,
+    _load_year,
+)
 
 
 class TestHolidayChecker:
 
-    @freeze_time("2024-01-01")
     def test_german_fixed_holidays(self):
         checker = HolidayChecker("DE")
 
@@ -20,7 +22,6 @@ class TestHolidayChecker:
         assert checker.is_holiday(date(2025, 12, 25)) # Weihnachten
         assert checker.is_holiday(date(2025, 12, 26))
 
-    @freeze_time("2024-01-01")
     def test_german_easter_holidays_2025(self):
         checker = HolidayChecker("DE")
 
@@ -45,4 +46,29 @@ class TestHolidayChecker:
         checker = HolidayChecker("DE")
 
         assert checker.get_holiday_name(date(2025, 1, 1)) == "New Year's Day"
-        assert checker.get_holiday_name(date(2025, 12, 25)) == "Christmas Day"
\ No newline at end of file
+        assert checker.get_holiday_name(date(2025, 12, 25)) == "Christmas Day"
+
+    def test_easter_dates(self):
+        assert _easter(2008) == date(2008, 3, 23)
+        assert _easter(2024) == date(2024, 3, 31)
+        assert _easter(2025) == date(2025, 4, 20)
+        assert _easter(2038) == date(2038, 4, 25)
+        assert _easter(2285) == date(2285, 3, 22)
+
+    def test_holidays_of_any_year(self):
+        checker = HolidayChecker("DE")
+
+        assert checker.is_holiday(date(1999, 12, 25))
+        assert checker.get_holiday_name(date(2100, 10, 3)) == "German Unity Day"
+        assert date(2100, 10, 3) in checker.holidays_in(2100)
+        assert not checker.holidays_in(2100) & checker.holidays_in(2101)
+
+    def test_years_are_computed_once(self):
+        _load_year.cache_clear()
+
+        HolidayChecker("DE").is_holiday(date(2031, 5, 1))
+        checker = HolidayChecker("DE")
+        assert checker.is_holiday(date(2031, 5, 1))
+        assert not checker.is_holiday(date(2031, 5, 2))
+
+        assert _load_year.cache_info().misses == 1
@@ -2,9 +2,32 @@
 Test cases for IMAP email client
 """
 
+import imaplib
+import ssl
+from unittest.mock import MagicMock
+
 import pytest
 
 from meeting_scheduler_mcp.calendar import BlockedTime
+from meeting_scheduler_mcp.mail import (
+    _IMAP4,
+    FETCH_PIPELINE_DEPTH,
+    KEEPALIVE_INTERVAL,
+    IMAPEmailClient,
+    _decode_part,
+    _find_text_part,
+    _load_imap_config,
+    _parse_fetch_response,
+)
+
+# BODYSTRUCTURE of multipart/mixed(multipart/alternative(text/plain, text/html),
+# application/pdf attachment)
+MIXED_STRUCTURE = (
+    b'((("TEXT" "PLAIN" ("CHARSET" "iso-8859-1") NIL NIL "QUOTED-PRINTABLE" 12 1)'
+    b'("TEXT" "HTML" ("CHARSET" "utf-8") NIL NIL "7BIT" 30 1) "ALTERNATIVE")'
+    b'("APPLICATION" "PDF" ("NAME" "a.pdf") NIL NIL "BASE64" 4000 NIL'
+    b' ("ATTACHMENT" ("FILENAME" "a.pdf")) NIL) "MIXED" ("BOUNDARY" "b1") NIL NIL)'
+)
 
 
 class TestBlockedTimeValidation:
@@ -112,5 +135,447 @@ class TestBlockedTimeValidation:
         assert end.second == 59
 
 
+class TestIMAPEmailClientSession:
+    """Test suite for the persistent IMAP session."""
+
+    @pytest.fixture
+    def client(self, mocker):
+        client = IMAPEmailClient()
+
+        def connect():
+            client._imap = MagicMock()
+
+        mocker.patch.object(client, "connect", side_effect=connect)
+        return client
+
+    def test_session_reuses_connection(self, client):
+        """Test that consecutive sessions share one connection."""
+        with client.session():
+            imap = client._imap
+        with client.session():
+            assert client._imap is imap
+        assert client.connect.call_count == 1
+
+    def test_session_reconnects_after_abort(self, client):
+        """Test that a broken connection is replaced on the next session."""
+        with pytest.raises(imaplib.IMAP4.abort), client.session():
+            raise imaplib.IMAP4.abort("socket error")
+        assert client._imap is None
+
+        with client.session():
+            assert client._imap is not None
+        assert client.connect.call_count == 2
+
+    def test_session_keeps_connection_after_no_reply(self, client):
+        """Test that an error reported by the server does not drop the connection."""
+        with pytest.raises(ConnectionError), client.session():
+            imap = client._imap
+            raise ConnectionError("Cannot select mailbox INBOX.Missing")
+
+        assert client._imap is imap
+        imap.shutdown.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error", [ConnectionResetError("reset"), ssl.SSLError("bad record mac")]
+    )
+    def test_session_drops_connection_after_socket_error(self, client, error):
+        """Test that socket and SSL errors discard the connection."""
+        with pytest.raises(OSError), client.session():
+            raise error
+
+        assert client._imap is None
+
+    def test_session_probes_idle_connection(self, client):
+        """Test that an idle connection is checked with NOOP and replaced if dead."""
+        with client.session():
+            imap = client._imap
+        imap.noop.side_effect = imaplib.IMAP4.abort("connection closed")
+        client._last_used -= KEEPALIVE_INTERVAL + 1
+
+        with client.session():
+            assert client._imap is not imap
+        imap.noop.assert_called_once()
+        assert client.connect.call_count == 2
+
+    def test_mailbox_selected_once_per_connection(self, client):
+        """Test that repeated searches do not re-select the same mailbox."""
+        with client.session():
+            client._imap.select.return_value = ("OK", [b"2"])
+            client._imap.uid.return_value = ("OK", [b"1 2"])
+            assert client.search_emails("INBOX") == [b"1", b"2"]
+        with client.session():
+            assert client.search_emails("INBOX") == [b"1", b"2"]
+            client._imap.select.assert_called_once_with("INBOX", readonly=True)
+
+            client.search_emails("INBOX.Archive")
+            assert client._imap.select.call_count == 2
+
+    def test_search_uses_uid_search_with_encoded_criteria(self, client):
+        """Test that searches return UIDs and send non-ASCII criteria as UTF-8."""
+        with client.session():
+            client._imap.select.return_value = ("OK", [b"2"])
+            client._imap.uid.return_value = ("OK", [b"101 102"])
+
+            assert client.search_emails("INBOX", "UNSEEN") == [b"101", b"102"]
+            client._imap.uid.assert_called_with("SEARCH", b"UNSEEN")
+
+            client.search_emails("INBOX", 'SUBJECT "Grüße"')
+            client._imap.uid.assert_called_with(
+                "SEARCH", b"CHARSET", b"UTF-8", 'SUBJECT "Grüße"'.encode()
+            )
+
+
+@pytest.fixture
+def imap_env(monkeypatch):
+    """Provide a complete IMAP configuration in the environment."""
+    monkeypatch.setenv("IMAP_HOST", "imap.example.com")
+    monkeypatch.setenv("IMAP_USER", "me@example.com")
+    monkeypatch.setenv("IMAP_PASSWORD", "secret")
+    monkeypatch.setenv("IMAP_VERIFY_SSL", "false")
+    monkeypatch.setenv("IMAP_DRAFT_FOLDER", "Drafts")
+    _load_imap_config.cache_clear()
+    yield
+    _load_imap_config.cache_clear()
+
+
+@pytest.mark.usefixtures("imap_env")
+class TestIMAPEmailClientConnect:
+    """Test suite for IMAP connection setup."""
+
+    def test_connect_reuses_config_and_ssl_context(self, mocker):
+        """Test that connections share the parsed config and SSL context."""
+        imap_ssl = mocker.patch("meeting_scheduler_mcp.mail._IMAP4_SSL")
+
+        IMAPEmailClient().connect()
+        IMAPEmailClient().connect()
+
+        first, second = imap_ssl.call_args_list
+        assert first.args == ("imap.example.com", 993)
+        assert first.kwargs["ssl_context"] is second.kwargs["ssl_context"]
+        assert first.kwargs["ssl_context"].check_hostname is False
+        imap_ssl.return_value.login.assert_called_with("me@example.com", "secret")
+        assert _load_imap_config.cache_info().misses == 1
+
+
+@pytest.mark.usefixtures("imap_env")
+class TestIMAPEmailClientSaveDraft:
+    """Test suite for saving drafts over IMAP."""
+
+    @pytest.fixture
+    def client(self):
+        client = IMAPEmailClient()
+        client._imap = MagicMock()
+        return client
+
+    def test_save_draft_appends_without_select(self, client):
+        """Test that a draft is appended to the drafts folder directly."""
+        client._imap.append.return_value = ("OK", [b"APPEND completed"])
+
+        assert client.save_draft("Subject", "Body", "you@example.com") is True
+
+        client._imap.select.assert_not_called()
+        client._imap.create.assert_not_called()
+        assert client._imap.append.call_args.args[0] == "Drafts"
+
+    def test_repeated_saves_only_append(self, client):
+        """Test that saving several drafts costs one APPEND each and nothing else."""
+        client._imap.append.return_value = ("OK", [b"APPEND completed"])
+
+        for _ in range(3):
+            assert client.save_draft("Subject", "Body", "you@example.com") is True
+
+        assert client._imap.append.call_count == 3
+        assert client._imap.method_calls == [
+            call for call in client._imap.method_calls if call[0] == "append"
+        ]
+
+    def test_save_draft_creates_missing_folder(self, client):
+        """Test that the drafts folder is created when APPEND is refused."""
+        client._imap.append.side_effect = [
+            ("NO", [b"[TRYCREATE] Mailbox does not exist"]),
+            ("OK", [b"APPEND completed"]),
+        ]
+        client._imap.create.return_value = ("OK", [b"CREATE completed"])
+
+        assert client.save_draft("Subject", "Body", "you@example.com") is True
+
+        client._imap.create.assert_called_once_with("Drafts")
+        first, second = client._imap.append.call_args_list
+        assert first.args == second.args
+
+    def test_exit_after_save_draft_logs_out_without_close(self, client, mocker):
+        """Test that leaving the context after an APPEND skips CLOSE."""
+        mocker.patch.object(client, "connect")
+        imap = client._imap
+        imap.state = "AUTH"
+        imap.close.side_effect = imaplib.IMAP4.error("CLOSE illegal in state AUTH")
+        imap.append.return_value = ("OK", [b"APPEND completed"])
+
+        with client:
+            assert client.save_draft("Subject", "Body", "you@example.com") is True
+
+        imap.close.assert_not_called()
+        imap.logout.assert_called_once()
+        assert client._imap is None
+
+    def test_close_closes_selected_mailbox(self, client):
+        """Test that a selected mailbox is closed before logging out."""
+        imap = client._imap
+        imap.state = "SELECTED"
+
+        client.close()
+
+        assert [call[0] for call in imap.method_calls] == ["close", "logout"]
+
+    def test_close_ignores_imap_errors(self, client):
+        """Test that a failing LOGOUT still releases the connection."""
+        client._imap.state = "AUTH"
+        client._imap.logout.side_effect = imaplib.IMAP4.error("LOGOUT failed")
+
+        client.close()
+
+        assert client._imap is None
+
+    @pytest.mark.parametrize(
+        "in_reply_to",
+        [
+            "<abc123@example.com>",
+            "<unique-id-12345@localhost>",
+            " <abc123@example.com>\n",
+        ],
+    )
+    def test_save_draft_threads_valid_message_ids(self, client, in_reply_to):
+        """Test that valid In-Reply-To values are trimmed and threaded."""
+        client._imap.append.return_value = ("OK", [b"APPEND completed"])
+
+        assert client.save_draft("Subject", "Body", "you@example.com", in_reply_to)
+
+        raw_message = client._imap.append.call_args.args[3]
+        message_id = in_reply_to.strip().encode()
+        assert b"In-Reply-To: " + message_id + b"\n" in raw_message
+        assert b"References: " + message_id + b"\n" in raw_message
+
+    @pytest.mark.parametrize(
+        "in_reply_to",
+        ["abc123@example.com", "<abc123@example.com> <def456@example.com>"],
+    )
+    def test_save_draft_refuses_malformed_message_ids(self, client, in_reply_to):
+        """Test that a draft is not saved outside of its thread."""
+        assert (
+            client.save_draft("Subject", "Body", "you@example.com", in_reply_to)
+            is False
+        )
+
+        client._imap.append.assert_not_called()
+
+
+class TestPipelinedFetch:
+    """Test suite for pipelined UID FETCH commands."""
+
+    @pytest.fixture
+    def client(self):
+        client = IMAPEmailClient()
+        client._imap = MagicMock()
+        client._imap._command.side_effect = [b"T%d" % i for i in range(20)]
+        client._imap._untagged_response.return_value = ("OK", [b"data"])
+        return client
+
+    def test_commands_are_sent_before_responses_are_read(self, client):
+        """Test that up to FETCH_PIPELINE_DEPTH commands are in flight at once."""
+        client._imap._command_complete.return_value = ("OK", [b"done"])
+        message_sets = [b"%d" % i for i in range(FETCH_PIPELINE_DEPTH + 2)]
+
+        assert client._pipelined_fetch(message_sets, "(UID)") == [b"data"]
+
+        calls = [call[0] for call in client._imap.method_calls]
+        first_read = calls.index("_command_complete")
+        assert calls[:first_read] == ["_command"] * FETCH_PIPELINE_DEPTH
+        assert calls.count("_command") == calls.count("_command_complete") == 10
+
+    def test_failed_fetch_still_reads_all_responses(self, client):
+        """Test that a refused command is reported after draining the pipeline."""
+        client._imap._command_complete.side_effect = [
+            ("NO", [b"failed"]),
+            ("OK", [b"done"]),
+        ]
+
+        with pytest.raises(ConnectionError, match="Cannot retrieve emails 1:5"):
+            client._pipelined_fetch([b"1:5", b"6:9"], "(UID)")
+
+        assert client._imap._command_complete.call_count == 2
+        client._imap._untagged_response.assert_called_once()
+
+    def test_bad_reply_still_reads_all_responses(self, client):
+        """Test that a BAD reply is re-raised only after draining the pipeline."""
+        client._imap._command_complete.side_effect = [
+            imaplib.IMAP4.error("UID command error: BAD [b'syntax']"),
+            ("OK", [b"done"]),
+            ("OK", [b"done"]),
+        ]
+
+        with pytest.raises(imaplib.IMAP4.error, match="BAD"):
+            client._pipelined_fetch([b"1:5", b"6:9", b"10:12"], "(UID)")
+
+        assert client._imap._command_complete.call_count == 3
+        client._imap._untagged_response.assert_called_once()
+
+    def test_abort_is_raised_at_once(self, client):
+        """Test that a dropped connection is not drained any further."""
+        client._imap._command_complete.side_effect = imaplib.IMAP4.abort("EOF")
+
+        with pytest.raises(imaplib.IMAP4.abort):
+            client._pipelined_fetch([b"1:5", b"6:9"], "(UID)")
+
+        assert client._imap._command_complete.call_count == 1
+
+
+class TestFetchMetadataBulk:
+    """Test suite for fetching the metadata of several emails at once."""
+
+    @pytest.fixture
+    def client(self, mocker):
+        client = IMAPEmailClient()
+        client._imap = MagicMock()
+        client._imap.select.return_value = ("OK", [b"3"])
+        mocker.patch.object(client, "_pipelined_fetch")
+        return client
+
+    def test_headers_of_all_ids_fetched_at_once(self, client):
+        """Test that one UID FETCH covers all ids and results keep their order."""
+        client._pipelined_fetch.return_value = [
+            (b"2 (UID 102 BODY[HEADER.FIELDS (SUBJECT)] {17}", b"Subject: Second\r\n"),
+            b")",
+            b"9 (FLAGS (\\Seen))",
+            (b"1 (UID 101 BODY[HEADER.FIELDS (SUBJECT)] {16}", b"Subject: First\r\n"),
+            b")",
+        ]
+
+        result = client.fetch_metadata_bulk([b"101", b"102"], with_body=False)
+
+        client._pipelined_fetch.assert_called_once()
+        assert client._pipelined_fetch.call_args.args[0] == [b"101,102"]
+        assert [metadata["subject"] for metadata in result] == ["First", "Second"]
+
+    def test_bodies_fetched_once_per_text_section(self, client):
+        """Test that text parts are fetched in one FETCH per section number."""
+        plain = b'("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 2 1)'
+        client._pipelined_fetch.side_effect = [
+            [
+                (b"1 (UID 101 BODY[HEADER.FIELDS (SUBJECT)] {4}", b"\r\n\r\n"),
+                b" BODYSTRUCTURE " + plain + b")",
+                (b"2 (UID 102 BODY[HEADER.FIELDS (SUBJECT)] {4}", b"\r\n\r\n"),
+                b" BODYSTRUCTURE " + plain + b")",
+            ],
+            [
+                (b"1 (UID 101 BODY[1] {2}", b"a!"),
+                b")",
+                (b"2 (UID 102 BODY[1] {2}", b"b!"),
+                b")",
+            ],
+        ]
+
+        result = client.fetch_metadata_bulk([b"101", b"102"])
+
+        assert [metadata["body"] for metadata in result] == ["a!", "b!"]
+        assert client._pipelined_fetch.call_args.args == (
+            [b"101,102"],
+            "(BODY.PEEK[1])",
+        )
+
+
+class TestLiteralPlusAppend:
+    """Test suite for APPEND with non-synchronizing literals."""
+
+    @pytest.fixture
+    def imap(self):
+        imap = _IMAP4.__new__(_IMAP4)
+        imap.utf8_enabled = False
+        imap.literal = None
+        imap._simple_command = MagicMock(return_value=("OK", [b"APPEND completed"]))
+        return imap
+
+    def test_append_sends_literal_inline(self, imap):
+        """Test that LITERAL+ servers get the message without a continuation."""
+        imap.capabilities = ("IMAP4REV1", "LITERAL+")
+
+        imap.append("Drafts", "", None, b"Subject: x\n\nbody\n")
+
+        name, *args = imap._simple_command.call_args.args
+        assert name == "APPEND"
+        assert args[-1] == b"{20+}\r\nSubject: x\r\n\r\nbody\r\n"
+        assert imap.literal is None
+
+    def test_append_falls_back_without_literal_plus(self, imap):
+        """Test that other servers get the standard synchronizing literal."""
+        imap.capabilities = ("IMAP4REV1",)
+
+        imap.append("Drafts", "", None, b"Subject: x\n\nbody\n")
+
+        assert imap.literal == b"Subject: x\r\n\r\nbody\r\n"
+
+
+class TestFetchResponseParsing:
+    """Test suite for parsing FETCH responses and BODYSTRUCTURE."""
+
+    def test_parse_fetch_response_with_literals_and_structure(self):
+        """Test that literals and trailing data items are grouped per message."""
+        data = [
+            (
+                b"1 (UID 7 BODY[HEADER.FIELDS (SUBJECT)] {16}",
+                b"Subject: Hi\r\n\r\n",
+            ),
+            b" BODYSTRUCTURE " + MIXED_STRUCTURE + b")",
+            (
+                b'2 (BODYSTRUCTURE ("TEXT" "PLAIN" NIL NIL NIL "7BIT" 3 1) BODY[1] {3}',
+                b"hey",
+            ),
+            b")",
+        ]
+
+        messages = _parse_fetch_response(data)
+
+        assert messages[b"1"][b"UID"] == b"7"
+        assert (
+            messages[b"1"][b"BODY[HEADER.FIELDS (SUBJECT)]"] == b"Subject: Hi\r\n\r\n"
+        )
+        assert messages[b"1"][b"BODYSTRUCTURE"][-4:] == [
+            b"MIXED",
+            [b"BOUNDARY", b"b1"],
+            None,
+            None,
+        ]
+        assert messages[b"2"][b"BODY[1]"] == b"hey"
+
+    def test_find_text_part_in_nested_multipart(self):
+        """Test that the text/plain part of a nested multipart is located."""
+        data = [b"1 (BODYSTRUCTURE " + MIXED_STRUCTURE + b")"]
+        structure = _parse_fetch_response(data)[b"1"][b"BODYSTRUCTURE"]
+
+        section, part = _find_text_part(structure)
+
+        assert section == "1.1"
+        assert _decode_part(b"Gr=FC=DFe", part) == "Grüße"
+
+    def test_find_text_part_skips_text_attachments(self):
+        """Test that text/plain attachments are not taken as the body."""
+        response = (
+            b'1 (BODYSTRUCTURE (("TEXT" "HTML" NIL NIL NIL "7BIT" 9 1)'
+            b'("TEXT" "PLAIN" NIL NIL NIL "BASE64" 8 1 NIL ("ATTACHMENT" NIL) NIL)'
+            b' "MIXED"))'
+        )
+        structure = _parse_fetch_response([response])[b"1"][b"BODYSTRUCTURE"]
+
+        assert _find_text_part(structure) is None
+
+    def test_find_text_part_in_single_part_message(self):
+        """Test that a single-part message is fetched as section 1."""
+        structure = [b"TEXT", b"HTML", None, None, None, b"BASE64", 8, 1]
+
+        section, part = _find_text_part(structure)
+
+        assert section == "1"
+        assert _decode_part(b"PHA+aGk8L3A+", part) == "<p>hi</p>"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,11 +3,15 @@ Integration tests for the complete workflow.
 """
 
 import pytest
-from freezegun import freeze_time
 
-from meeting_scheduler_mcp.tools import _save_draft_and_block_slot_internal as save_draft_func
+from meeting_scheduler_mcp.tools import (
+    _save_draft_and_block_slot_internal as save_draft_func,
+)
 from tests.conftest import MockEmailClient
 
+# The tools write blocked slots, keep them out of the working directory
+pytestmark = pytest.mark.usefixtures("tools_calendar")
+
 
 class TestIntegration:
     """Integration tests for the complete workflow."""
@@ -90,9 +94,65 @@ class TestIntegration:
         draft = mock_email_client._get_drafts()[0]
         assert draft["in_reply_to"] == "<original-request@example.com>"
 
-    @freeze_time("2025-12-15 08:00:00", tz_offset=1)
-    def test_calendar_blocking_integration(self, temp_calendar):
+    def test_save_draft_and_block_slot_rejects_malformed_in_reply_to(
+        self, mock_email_client: MockEmailClient, tools_calendar
+    ):
+        """Test that a malformed Message-ID is reported before anything is saved."""
+        result = save_draft_func(
+            datetime="2025-12-15T14:00:00+01:00",
+            duration=60,
+            reason="Meeting",
+            subject="Re: Meeting Request",
+            body="Meeting confirmed",
+            to="test@example.com",
+            in_reply_to="original-request@example.com",
+            email_client=mock_email_client,
+        )
+
+        assert result["success"] is False
+        assert "in_reply_to" in result["error"]
+        assert mock_email_client._get_draft_count() == 0
+        assert tools_calendar.calendar_store.load().blocked == []
+
+    def test_save_draft_and_block_slot_trims_in_reply_to(
+        self, mock_email_client: MockEmailClient
+    ):
+        """Test that whitespace around the Message-ID is not fatal."""
+        result = save_draft_func(
+            datetime="2025-12-15T14:00:00+01:00",
+            duration=60,
+            reason="Meeting",
+            subject="Re: Meeting Request",
+            body="Meeting confirmed",
+            to="test@example.com",
+            in_reply_to=" <original-request@example.com>\n",
+            email_client=mock_email_client,
+        )
+
+        assert result["success"] is True
+        draft = mock_email_client._get_drafts()[0]
+        assert draft["in_reply_to"] == "<original-request@example.com>"
+
+    def test_mock_client_fetches_metadata_without_body(
+        self, mock_email_client: MockEmailClient
+    ):
+        """Test that the mock client honours with_body like the IMAP client."""
+        with mock_email_client:
+            mock_email_client.save_draft("Subject", "Body", "test@example.com")
+            email_ids = mock_email_client.search_emails()
+
+            with_body = mock_email_client.fetch_metadata_bulk(email_ids)
+            headers_only = mock_email_client.fetch_metadata_bulk(
+                email_ids, with_body=False
+            )
+
+        assert with_body[0]["body"] == "Body"
+        assert "body" not in headers_only[0]
+        assert headers_only[0]["subject"] == "Subject"
+
+    def test_calendar_blocking_integration(self, temp_calendar, frozen_now):
         """Test that the calendar blocking works correctly."""
+        frozen_now("2025-12-15T08:00:00+01:00")
         # Get the calendar manager from the fixture
         _, calendar_manager = temp_calendar
 
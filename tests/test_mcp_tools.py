@@ -3,34 +3,38 @@ Integration tests for MCP tools.
 Tests the email search and draft functionality with threading support.
 """
 
+import importlib
 from unittest.mock import MagicMock, patch
 
-# Import the underlying function from tools module
-from meeting_scheduler_mcp.tools import search_emails
+import pytest
 
-# The function is now plain, no wrapper needed
-search_emails_func = search_emails
+from meeting_scheduler_mcp.mail import is_valid_message_id
+
+# Import the blocking implementation behind the async search_emails tool
+from meeting_scheduler_mcp.tools import _search_emails_internal as search_emails_func
+
+# Keep the tools off the calendar.yaml of the working directory
+pytestmark = pytest.mark.usefixtures("tools_calendar")
 
 
 class TestMCPEmailTools:
     """Test suite for MCP email tools."""
 
-    @patch("meeting_scheduler_mcp.tools.IMAPEmailClient")
-    def test_search_emails_with_metadata(self, mock_imap_client_class):
+    @patch("meeting_scheduler_mcp.tools.get_shared_client")
+    def test_search_emails_with_metadata(self, mock_get_shared_client):
         """Test that search_emails_tool returns full email metadata including threading info."""
         # Setup mock instance
         mock_client = MagicMock()
-        mock_imap_client_class.return_value = mock_client
+        mock_get_shared_client.return_value = mock_client
 
-        # Configure context manager behavior
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=None)
+        # Configure session context manager behavior
+        mock_client.session.return_value.__enter__.return_value = mock_client
 
         # Mock email IDs
         mock_client.search_emails.return_value = [b"1", b"2"]
 
         # Mock email metadata with threading information
-        mock_client.get_email_metadata.side_effect = [
+        mock_client.fetch_metadata_bulk.return_value = [
             {
                 "subject": "Meeting Request",
                 "from": "client@example.com",
@@ -86,7 +90,8 @@ class TestMCPEmailTools:
 
         # Verify mock calls
         mock_client.search_emails.assert_called_once_with("INBOX", "UNSEEN")
-        assert mock_client.get_email_metadata.call_count == 2
+        mock_client.fetch_metadata_bulk.assert_called_once_with([b"1", b"2"], "INBOX")
+        mock_client.get_email_metadata.assert_not_called()
 
     def test_email_threading_relationships(self):
         """Test logic for identifying email threading relationships."""
@@ -121,9 +126,11 @@ class TestMCPEmailTools:
 
         # Test finding entire thread
         thread = [emails[0]]  # Start with original
+        seen = {emails[0]["message_id"]}  # Message-IDs in the thread so far
         for email in emails[1:]:  # Add replies
-            if email["in_reply_to"] in [e["message_id"] for e in thread]:
+            if email["in_reply_to"] in seen:
                 thread.append(email)
+                seen.add(email["message_id"])
 
         assert len(thread) == 3
         assert thread[0]["id"] == "1"  # Original
@@ -145,17 +152,47 @@ class TestMCPEmailTools:
             "",  # Empty string
         ]
 
-        # Test valid formats
         for msg_id in valid_message_ids:
-            assert msg_id.startswith("<") and msg_id.endswith(">")
-            assert len(msg_id) > 2  # Not just <>
-            content = msg_id[1:-1]  # Remove angle brackets
-            assert "@" in content  # Should contain @
-            assert "." in content or content.count("@") > 1  # Should have domain
+            assert is_valid_message_id(msg_id)
 
-        # Test invalid formats
         for msg_id in invalid_message_ids:
-            is_valid = (
-                msg_id.startswith("<") and msg_id.endswith(">") and len(msg_id) > 2
-            )
-            assert not is_valid
+            assert not is_valid_message_id(msg_id)
+
+
+class TestToolsModule:
+    """Test suite for the state of the tools module."""
+
+    def test_shared_client_follows_loaded_imap_config(self, monkeypatch):
+        """Test that the shared client is keyed by the config it connects with."""
+        from meeting_scheduler_mcp import tools
+        from meeting_scheduler_mcp.mail import _load_imap_config
+
+        monkeypatch.setattr(tools, "_email_clients", {})
+        monkeypatch.setenv("IMAP_HOST", "imap.example.com")
+        _load_imap_config.cache_clear()
+        try:
+            client = tools.get_shared_client()
+
+            # The config is read once, so a later env change alone keeps the client
+            monkeypatch.setenv("IMAP_HOST", "imap.example.org")
+            assert tools.get_shared_client() is client
+
+            _load_imap_config.cache_clear()
+            assert tools.get_shared_client() is not client
+        finally:
+            _load_imap_config.cache_clear()
+
+    def test_import_does_not_write_calendar(self, tmp_path, monkeypatch):
+        """Test that the calendar files are only created by the first tool call."""
+        from meeting_scheduler_mcp import tools
+
+        workdir = tmp_path / "workdir"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+        monkeypatch.setattr(tools, "calendar_manager", None)
+
+        importlib.reload(tools)
+        assert list(workdir.iterdir()) == []
+
+        tools.get_calendar_manager()
+        assert (workdir / "calendar.yaml").exists()
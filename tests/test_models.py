@@ -6,12 +6,16 @@ from datetime import date, time
 from zoneinfo import ZoneInfo
 
 import pytest
+from pydantic import ValidationError
 
 from meeting_scheduler_mcp.calendar import (
     BlockedTime,
+    Calendar,
+    Schedule,
     TimeSlot,
     Weekday,
     WeeklyAvailability,
+    get_tz,
 )
 
 
@@ -42,6 +46,57 @@ class TestWeeklyAvailability:
             WeeklyAvailability(days=[], slots=[])
 
 
+class TestSchedule:
+    def test_weekday_slots(self):
+        morning = TimeSlot(start=time(9, 0), end=time(12, 0))
+        afternoon = TimeSlot(start=time(13, 0), end=time(17, 0))
+        schedule = Schedule(
+            timezone="Europe/Berlin",
+            slot_duration=30,
+            weekly=[
+                WeeklyAvailability(days=[Weekday.MON, Weekday.TUE], slots=[morning]),
+                WeeklyAvailability(days=[Weekday.TUE], slots=[afternoon]),
+            ],
+        )
+
+        assert schedule.weekday_slots() == {1: (morning,), 2: (morning, afternoon)}
+
+    def test_weekday_slots_follow_replaced_weekly(self):
+        slot = TimeSlot(start=time(9, 0), end=time(12, 0))
+        schedule = Schedule(
+            timezone="Europe/Berlin",
+            slot_duration=30,
+            weekly=[WeeklyAvailability(days=[Weekday.MON], slots=[slot])],
+        )
+        assert 1 in schedule.weekday_slots()
+
+        copy = schedule.model_copy(
+            update={"weekly": [WeeklyAvailability(days=[Weekday.FRI], slots=[slot])]}
+        )
+
+        assert copy.weekday_slots() == {5: (slot,)}
+
+    def test_weekday_slots_follow_weekly_changed_in_place(self):
+        slot = TimeSlot(start=time(9, 0), end=time(12, 0))
+        schedule = Schedule(
+            timezone="Europe/Berlin",
+            slot_duration=30,
+            weekly=[WeeklyAvailability(days=[Weekday.MON], slots=[slot])],
+        )
+        assert schedule.weekday_slots() == {1: (slot,)}
+
+        schedule.weekly.append(WeeklyAvailability(days=[Weekday.FRI], slots=[slot]))
+        schedule.weekly[0].days.append(Weekday.TUE)
+
+        assert schedule.weekday_slots() == {1: (slot,), 2: (slot,), 5: (slot,)}
+
+    def test_timezone_resolved_once(self):
+        schedule = Schedule(timezone="Europe/Berlin", slot_duration=30, weekly=[])
+
+        assert schedule.get_tz() is get_tz("Europe/Berlin")
+        assert schedule.get_tz().key == "Europe/Berlin"
+
+
 class TestBlockedTime:
     def test_datetime_with_duration(self):
         blocked = BlockedTime(
@@ -85,3 +140,49 @@ class TestBlockedTime:
                 duration=60,
                 until="2024-12-23T12:00+01:00",
             )
+
+    def test_fields_are_read_only(self):
+        blocked = BlockedTime(datetime="2024-12-23T10:00+01:00", duration=60)
+
+        with pytest.raises(ValidationError, match="frozen"):
+            blocked.duration = 120
+
+    def test_hashable_by_fields(self):
+        blocked = BlockedTime(datetime="2024-12-24", reason="Feiertag")
+        blocked.get_bounds_us(ZoneInfo("Europe/Berlin"))
+        same = BlockedTime(datetime="2024-12-24", reason="Feiertag")
+
+        # The cached bounds affect neither equality nor the hash
+        assert blocked == same
+        assert hash(blocked) == hash(same)
+        assert len({blocked, same, BlockedTime(datetime="2024-12-25")}) == 2
+
+    def test_bounds_resolved_on_calendar_load(self):
+        calendar = Calendar.model_validate(
+            {
+                "schedule": {
+                    "timezone": "Europe/Berlin",
+                    "slot_duration": 30,
+                    "weekly": [],
+                },
+                "blocked": [{"datetime": "2024-12-24", "reason": "Feiertag"}],
+            }
+        )
+        blocked = calendar.blocked[0]
+        tz = ZoneInfo("Europe/Berlin")
+
+        assert blocked._bounds is not None
+        start, end = blocked.get_bounds_us(tz)
+        assert start == int(blocked.get_start(tz).timestamp() * 1_000_000)
+        assert end == int(blocked.get_end(tz).timestamp() * 1_000_000)
+        assert blocked == BlockedTime(datetime="2024-12-24", reason="Feiertag")
+
+    def test_bounds_parsed_once_per_timezone(self):
+        blocked = BlockedTime(datetime="2024-12-23T10:00+01:00", duration=60)
+        berlin = get_tz("Europe/Berlin")
+
+        start, end = blocked.get_bounds(berlin)
+
+        assert blocked.get_start(berlin) is start
+        assert blocked.get_end(berlin) is end
+        assert blocked.get_end(ZoneInfo("UTC")) == end
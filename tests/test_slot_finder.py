@@ -2,10 +2,10 @@
 Test cases for slot finder.
 """
 
+from dataclasses import FrozenInstanceError
 from datetime import date, time
 
 import pytest
-from freezegun import freeze_time
 
 from meeting_scheduler_mcp.calendar import (
     BlockedTime,
@@ -42,8 +42,8 @@ def basic_calendar() -> Calendar:
 
 class TestSlotFinderBasic:
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)  # Montag
-    def test_generates_slots_for_workday(self, basic_calendar):
+    def test_generates_slots_for_workday(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")  # Montag
         finder = SlotFinder(basic_calendar)
 
         slots = finder.find_available_slots(
@@ -59,8 +59,8 @@ class TestSlotFinderBasic:
         if slots:
             assert slots[0].start_time >= time(9, 0)
 
-    @freeze_time("2025-01-04 08:00:00", tz_offset=1)  # Samstag
-    def test_no_slots_on_weekend(self, basic_calendar):
+    def test_no_slots_on_weekend(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-04T08:00:00+01:00")  # Samstag
         finder = SlotFinder(basic_calendar)
 
         slots = finder.find_available_slots(
@@ -71,8 +71,8 @@ class TestSlotFinderBasic:
 
         assert len(slots) == 0
 
-    @freeze_time("2025-01-01 08:00:00", tz_offset=1)  # Neujahr
-    def test_no_slots_on_holiday(self, basic_calendar):
+    def test_no_slots_on_holiday(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-01T08:00:00+01:00")  # Neujahr
         finder = SlotFinder(basic_calendar)
 
         slots = finder.find_available_slots(
@@ -83,11 +83,41 @@ class TestSlotFinderBasic:
 
         assert len(slots) == 0
 
+    def test_only_available_weekdays_visited(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-04T08:00:00+01:00")  # Samstag
+        basic_calendar.schedule.weekly = [
+            WeeklyAvailability(
+                days=[Weekday.WED, Weekday.SUN],
+                slots=[TimeSlot(start=time(9, 0), end=time(9, 30))]
+            )
+        ]
+        finder = SlotFinder(basic_calendar)
+
+        slots = finder.find_available_slots(
+            from_date=date(2025, 1, 4),
+            to_date=date(2025, 1, 19),
+            max_results=50
+        )
+
+        assert [s.date for s in slots] == [
+            date(2025, 1, 5),
+            date(2025, 1, 8),
+            date(2025, 1, 12),
+            date(2025, 1, 15),
+            date(2025, 1, 19),
+        ]
+
+    def test_no_slots_without_weekly_availability(self, basic_calendar):
+        basic_calendar.schedule.weekly = []
+        finder = SlotFinder(basic_calendar)
+
+        assert finder.find_available_slots(from_date=date(2025, 1, 6), max_results=50) == []
+
 
 class TestSlotFinderWithBlocks:
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_blocked_slot_excluded(self, basic_calendar):
+    def test_blocked_slot_excluded(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         basic_calendar.blocked.append(
             BlockedTime(
                 datetime="2025-01-06T10:00+01:00",
@@ -109,8 +139,8 @@ class TestSlotFinderWithBlocks:
         assert time(10, 30) not in slot_starts
         assert time(11, 0) in slot_starts
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_all_day_block(self, basic_calendar):
+    def test_all_day_block(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         basic_calendar.blocked.append(
             BlockedTime(datetime="2025-01-06", reason="Urlaub")
         )
@@ -124,8 +154,8 @@ class TestSlotFinderWithBlocks:
 
         assert len(slots) == 0
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_multi_day_block(self, basic_calendar):
+    def test_multi_day_block(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         basic_calendar.blocked.append(
             BlockedTime(
                 datetime="2025-01-06",
@@ -149,11 +179,87 @@ class TestSlotFinderWithBlocks:
         assert date(2025, 1, 9) in slot_dates
         assert date(2025, 1, 10) in slot_dates
 
+    def test_repeated_search_reuses_result_until_slot_passes(self, basic_calendar, frozen_now):
+        finder = SlotFinder(basic_calendar)
+        search = {
+            "from_date": date(2025, 1, 6),
+            "to_date": date(2025, 1, 6),
+            "min_notice_hours": 0,
+        }
+
+        frozen_now("2025-01-06T09:01:00+01:00")
+        first = finder.find_available_slots(**search)
+        frozen_now("2025-01-06T09:29:00+01:00")
+        again = finder.find_available_slots(**search)
+        frozen_now("2025-01-06T09:31:00+01:00")
+        later = finder.find_available_slots(**search)
+
+        assert first[0].start_time == time(9, 30)
+        assert again == first
+        with pytest.raises(FrozenInstanceError):
+            first[0].start_time = time(12, 0)
+        assert finder._find_slots.cache_info().hits == 1
+        assert later[0].start_time == time(10, 0)
+
+    def test_block_ending_at_slot_start_does_not_overlap(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
+        basic_calendar.blocked.append(
+            BlockedTime(datetime="2025-01-07T09:00+01:00", duration=30, reason="Kurz")
+        )
+
+        finder = SlotFinder(basic_calendar)
+
+        assert finder.is_slot_bookable(date(2025, 1, 7), time(9, 30), time(10, 0)) == (True, "")
+        assert finder.is_slot_bookable(date(2025, 1, 7), time(9, 0), time(9, 30)) == (False, "Kurz")
+
+    def test_long_block_behind_later_short_blocks(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
+        # The long block starts first but is not the last one starting before the slot
+        basic_calendar.blocked.extend([
+            BlockedTime(datetime="2025-01-07T09:00+01:00", duration=240, reason="Lang"),
+            BlockedTime(datetime="2025-01-07T09:30+01:00", duration=30, reason="Kurz"),
+            BlockedTime(datetime="2025-01-07T10:00+01:00", duration=30, reason="Kurz"),
+        ])
+
+        finder = SlotFinder(basic_calendar)
+        slots = finder.find_available_slots(
+            from_date=date(2025, 1, 7),
+            to_date=date(2025, 1, 7),
+            max_results=50
+        )
+
+        assert finder.is_slot_bookable(date(2025, 1, 7), time(11, 0), time(11, 30)) == (False, "Lang")
+        assert slots[0].start_time == time(13, 0)
+
+    def test_block_on_daylight_saving_day(self, basic_calendar, frozen_now):
+        frozen_now("2025-03-28T08:00:00+01:00")
+        basic_calendar.schedule.weekly = [
+            WeeklyAvailability(
+                days=[Weekday.SUN],
+                slots=[TimeSlot(start=time(1, 0), end=time(4, 0))]
+            )
+        ]
+        basic_calendar.blocked.append(
+            BlockedTime(datetime="2025-03-30T03:00+02:00", duration=30, reason="Sommerzeit")
+        )
+
+        finder = SlotFinder(basic_calendar)
+        slots = finder.find_available_slots(
+            from_date=date(2025, 3, 30),
+            to_date=date(2025, 3, 30),
+            max_results=50
+        )
+
+        slot_starts = [s.start_time for s in slots]
+        assert time(1, 30) in slot_starts
+        assert time(3, 0) not in slot_starts
+        assert time(3, 30) in slot_starts
+
 
 class TestIsSlotBookable:
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_valid_slot_bookable(self, basic_calendar):
+    def test_valid_slot_bookable(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         finder = SlotFinder(basic_calendar)
 
         bookable, reason = finder.is_slot_bookable(
@@ -163,8 +269,8 @@ class TestIsSlotBookable:
         assert bookable is True
         assert reason == ""
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_holiday_not_bookable(self, basic_calendar):
+    def test_holiday_not_bookable(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         finder = SlotFinder(basic_calendar)
 
         bookable, reason = finder.is_slot_bookable(
@@ -174,8 +280,8 @@ class TestIsSlotBookable:
         assert bookable is False
         assert "Christmas Day" in reason
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_weekend_not_bookable(self, basic_calendar):
+    def test_weekend_not_bookable(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         finder = SlotFinder(basic_calendar)
 
         bookable, reason = finder.is_slot_bookable(
@@ -185,8 +291,8 @@ class TestIsSlotBookable:
         assert bookable is False
         assert "availability" in reason
 
-    @freeze_time("2025-01-06 08:00:00", tz_offset=1)
-    def test_blocked_not_bookable(self, basic_calendar):
+    def test_blocked_not_bookable(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
         basic_calendar.blocked.append(
             BlockedTime(
                 datetime="2025-01-06T14:00+01:00",
@@ -203,3 +309,38 @@ class TestIsSlotBookable:
 
         assert bookable is False
         assert "Lisa" in reason
+
+    def test_slot_spanning_adjacent_ranges(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
+        basic_calendar.schedule.weekly.append(
+            WeeklyAvailability(
+                days=[Weekday.MON],
+                slots=[TimeSlot(start=time(12, 0), end=time(13, 0))],
+            )
+        )
+        finder = SlotFinder(basic_calendar)
+
+        assert finder.is_slot_bookable(
+            date(2025, 1, 6), time(11, 30), time(13, 30)
+        ) == (True, "")
+        assert finder.is_slot_bookable(
+            date(2025, 1, 7), time(11, 30), time(13, 30)
+        ) == (False, "Outside of availability")
+
+    def test_weekly_changed_in_place_after_first_lookup(self, basic_calendar, frozen_now):
+        frozen_now("2025-01-06T08:00:00+01:00")
+        saturday = date(2025, 1, 11)
+        assert SlotFinder(basic_calendar).is_slot_bookable(
+            saturday, time(10, 0), time(10, 30)
+        ) == (False, "Outside of availability")
+
+        basic_calendar.schedule.weekly.append(
+            WeeklyAvailability(
+                days=[Weekday.SAT],
+                slots=[TimeSlot(start=time(10, 0), end=time(12, 0))],
+            )
+        )
+        finder = SlotFinder(basic_calendar)
+
+        assert finder.is_slot_bookable(saturday, time(10, 0), time(10, 30)) == (True, "")
+        assert 6 in finder._day_slots